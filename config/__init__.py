@@ -2,15 +2,18 @@
 Configuration package for Sentinel Detection Linter
 """
 
-from .schema_definition import EXPECTED_TYPES, REQUIRED_FIELDS, SENTINEL_SCHEMA
-from .entity_identifiers import ENTITY_STRONG_IDENTIFIERS
-from .asim_field_names import VALID_ASIM_FIELD_NAMES, ENTITY_TO_ASIM_PATTERNS
+from .schema_definition import EXPECTED_TYPES, REQUIRED_FIELDS, REQUIRED_FIELDS_ORDER, SENTINEL_SCHEMA
+from .entity_identifiers import ENTITY_STRONG_IDENTIFIERS, ENTITY_STRONG_IDENTIFIERS_ORDER
+from .asim_field_names import VALID_ASIM_FIELD_NAMES, ENTITY_TO_ASIM_PATTERNS, ENTITY_VALID_FIELDS
 
 __all__ = [
     'EXPECTED_TYPES',
     'REQUIRED_FIELDS',
+    'REQUIRED_FIELDS_ORDER',
     'SENTINEL_SCHEMA',
     'ENTITY_STRONG_IDENTIFIERS',
+    'ENTITY_STRONG_IDENTIFIERS_ORDER',
     'VALID_ASIM_FIELD_NAMES',
-    'ENTITY_TO_ASIM_PATTERNS'
+    'ENTITY_TO_ASIM_PATTERNS',
+    'ENTITY_VALID_FIELDS'
 ]
@@ -0,0 +1,316 @@
+"""
+Generated ASIM field names - DO NOT EDIT
+Produced by tools/gen_asim_fields.py from the tables in asim_field_names.py.
+"""
+
+VALID_ASIM_FIELD_NAMES = frozenset((
+    'Account',
+    'AccountType',
+    'ActingAppId',
+    'ActingAppName',
+    'ActingAppType',
+    'ActingProcessCommandLine',
+    'ActingProcessCreationTime',
+    'ActingProcessCurrentDirectory',
+    'ActingProcessEndTime',
+    'ActingProcessFileCompany',
+    'ActingProcessFileDescription',
+    'ActingProcessFileInternalName',
+    'ActingProcessFileMD5',
+    'ActingProcessFileOriginalName',
+    'ActingProcessFileProduct',
+    'ActingProcessFileSHA1',
+    'ActingProcessFileSHA256',
+    'ActingProcessFileSHA512',
+    'ActingProcessFileVersion',
+    'ActingProcessGuid',
+    'ActingProcessId',
+    'ActingProcessIntegrityLevel',
+    'ActingProcessName',
+    'ActingProcessStartTime',
+    'ActingProcessTokenElevation',
+    'ActorDomain',
+    'ActorDomainType',
+    'ActorEmailAddress',
+    'ActorOriginalUserType',
+    'ActorSessionId',
+    'ActorUpn',
+    'ActorUserId',
+    'ActorUserIdType',
+    'ActorUserScope',
+    'ActorUserScopeId',
+    'ActorUserType',
+    'ActorUsername',
+    'AlertName',
+    'AlertSeverity',
+    'Application',
+    'Bytes',
+    'CloudAppId',
+    'CloudAppName',
+    'CloudAppOperation',
+    'CloudAppRiskLevel',
+    'Computer',
+    'DnsFlagsAuthenticated',
+    'DnsFlagsAuthoritative',
+    'DnsFlagsCheckingDisabled',
+    'DnsFlagsRecursionAvailable',
+    'DnsFlagsRecursionDesired',
+    'DnsFlagsTruncated',
+    'DnsQuery',
+    'DnsQueryClass',
+    'DnsQueryClassName',
+    'DnsQueryType',
+    'DnsQueryTypeName',
+    'DnsResponseCode',
+    'DnsResponseCodeName',
+    'DnsResponseName',
+    'DstAction',
+    'DstBytes',
+    'DstDescription',
+    'DstDomain',
+    'DstDomainType',
+    'DstEmailAddress',
+    'DstFQDN',
+    'DstGeoCity',
+    'DstGeoCountry',
+    'DstGeoLatitude',
+    'DstGeoLongitude',
+    'DstGeoRegion',
+    'DstHostname',
+    'DstId',
+    'DstIdType',
+    'DstInterface',
+    'DstIpAddr',
+    'DstMacAddr',
+    'DstOriginalAction',
+    'DstOriginalUserType',
+    'DstOs',
+    'DstOsVersion',
+    'DstPackets',
+    'DstPortNumber',
+    'DstScope',
+    'DstScopeId',
+    'DstSessionId',
+    'DstType',
+    'DstUpn',
+    'DstUserId',
+    'DstUserIdType',
+    'DstUserScope',
+    'DstUserScopeId',
+    'DstUserType',
+    'DstUsername',
+    'DstVlanId',
+    'DstZone',
+    'DvcAction',
+    'DvcDescription',
+    'DvcDomain',
+    'DvcDomainType',
+    'DvcFQDN',
+    'DvcHostname',
+    'DvcId',
+    'DvcIdType',
+    'DvcInterface',
+    'DvcIpAddr',
+    'DvcMacAddr',
+    'DvcOriginalAction',
+    'DvcOs',
+    'DvcOsVersion',
+    'DvcScope',
+    'DvcScopeId',
+    'DvcType',
+    'DvcZone',
+    'EmailDirection',
+    'EmailRecipient',
+    'EmailRecipientName',
+    'EmailSenderAddress',
+    'EmailSenderName',
+    'EmailSubject',
+    'EventMessage',
+    'EventOriginalResultDetails',
+    'EventOriginalType',
+    'EventResult',
+    'EventResultDetails',
+    'EventType',
+    'Hostname',
+    'HttpContentFormat',
+    'HttpContentType',
+    'HttpReferrer',
+    'HttpRequestMethod',
+    'HttpStatusCode',
+    'HttpUserAgent',
+    'HttpVersion',
+    'ImpersonationLevel',
+    'InnerVlanId',
+    'IpAddr',
+    'LogonType',
+    'NetworkApplicationProtocol',
+    'NetworkConnectionHistory',
+    'NetworkDirection',
+    'NetworkDuration',
+    'NetworkIcmpCode',
+    'NetworkIcmpType',
+    'NetworkProtocol',
+    'NetworkProtocolVersion',
+    'NetworkRuleName',
+    'NetworkRuleNumber',
+    'OuterVlanId',
+    'Packets',
+    'ParentProcessCommandLine',
+    'ParentProcessCreationTime',
+    'ParentProcessCurrentDirectory',
+    'ParentProcessEndTime',
+    'ParentProcessFileCompany',
+    'ParentProcessFileDescription',
+    'ParentProcessFileInternalName',
+    'ParentProcessFileMD5',
+    'ParentProcessFileOriginalName',
+    'ParentProcessFileProduct',
+    'ParentProcessFileSHA1',
+    'ParentProcessFileSHA256',
+    'ParentProcessFileSHA512',
+    'ParentProcessFileVersion',
+    'ParentProcessGuid',
+    'ParentProcessId',
+    'ParentProcessIntegrityLevel',
+    'ParentProcessName',
+    'ParentProcessStartTime',
+    'ParentProcessTokenElevation',
+    'PortNumber',
+    'PrivilegeList',
+    'RegistryKey',
+    'RegistryPreviousKey',
+    'RegistryPreviousValue',
+    'RegistryPreviousValueData',
+    'RegistryPreviousValueType',
+    'RegistryValue',
+    'RegistryValueData',
+    'RegistryValueType',
+    'RuleName',
+    'RuleNumber',
+    'SrcAction',
+    'SrcBytes',
+    'SrcDescription',
+    'SrcDomain',
+    'SrcDomainType',
+    'SrcEmailAddress',
+    'SrcFQDN',
+    'SrcFileContentType',
+    'SrcFileCreationTime',
+    'SrcFileDirectory',
+    'SrcFileExtension',
+    'SrcFileHashType',
+    'SrcFileMD5',
+    'SrcFileMimeType',
+    'SrcFileName',
+    'SrcFilePath',
+    'SrcFilePathType',
+    'SrcFileSHA1',
+    'SrcFileSHA256',
+    'SrcFileSHA512',
+    'SrcFileSize',
+    'SrcGeoCity',
+    'SrcGeoCountry',
+    'SrcGeoLatitude',
+    'SrcGeoLongitude',
+    'SrcGeoRegion',
+    'SrcHostname',
+    'SrcId',
+    'SrcIdType',
+    'SrcInterface',
+    'SrcIpAddr',
+    'SrcMacAddr',
+    'SrcOriginalAction',
+    'SrcOriginalUserType',
+    'SrcOs',
+    'SrcOsVersion',
+    'SrcPackets',
+    'SrcPortNumber',
+    'SrcScope',
+    'SrcScopeId',
+    'SrcSessionId',
+    'SrcType',
+    'SrcUpn',
+    'SrcUserId',
+    'SrcUserIdType',
+    'SrcUserScope',
+    'SrcUserScopeId',
+    'SrcUserType',
+    'SrcUsername',
+    'SrcVlanId',
+    'SrcZone',
+    'SubjectDomainName',
+    'SubjectUserName',
+    'SubjectUserSid',
+    'TargetAppId',
+    'TargetAppName',
+    'TargetAppType',
+    'TargetDomain',
+    'TargetDomainName',
+    'TargetDomainType',
+    'TargetEmailAddress',
+    'TargetFileContentType',
+    'TargetFileCreationTime',
+    'TargetFileDirectory',
+    'TargetFileExtension',
+    'TargetFileHashType',
+    'TargetFileMD5',
+    'TargetFileMimeType',
+    'TargetFileName',
+    'TargetFilePath',
+    'TargetFilePathType',
+    'TargetFileSHA1',
+    'TargetFileSHA256',
+    'TargetFileSHA512',
+    'TargetFileSize',
+    'TargetOriginalUserType',
+    'TargetProcessCommandLine',
+    'TargetProcessCreationTime',
+    'TargetProcessCurrentDirectory',
+    'TargetProcessEndTime',
+    'TargetProcessFileCompany',
+    'TargetProcessFileDescription',
+    'TargetProcessFileInternalName',
+    'TargetProcessFileMD5',
+    'TargetProcessFileOriginalName',
+    'TargetProcessFileProduct',
+    'TargetProcessFileSHA1',
+    'TargetProcessFileSHA256',
+    'TargetProcessFileSHA512',
+    'TargetProcessFileVersion',
+    'TargetProcessGuid',
+    'TargetProcessId',
+    'TargetProcessIntegrityLevel',
+    'TargetProcessName',
+    'TargetProcessStartTime',
+    'TargetProcessTokenElevation',
+    'TargetSessionId',
+    'TargetUpn',
+    'TargetUserId',
+    'TargetUserIdType',
+    'TargetUserName',
+    'TargetUserScope',
+    'TargetUserScopeId',
+    'TargetUserSid',
+    'TargetUserType',
+    'TargetUsername',
+    'ThreatCategory',
+    'ThreatConfidence',
+    'ThreatField',
+    'ThreatFirstReportedTime',
+    'ThreatId',
+    'ThreatIpAddr',
+    'ThreatIsActive',
+    'ThreatLastReportedTime',
+    'ThreatName',
+    'ThreatOriginalConfidence',
+    'ThreatOriginalRiskLevel',
+    'ThreatRiskLevel',
+    'Url',
+    'UrlCategory',
+    'UrlDomain',
+    'UrlHostname',
+    'UrlOriginal',
+    'User',
+    'VlanId',
+    'WorkstationName',
+))
@@ -5,6 +5,9 @@ for entity mappings.
 Reference: https://learn.microsoft.com/en-us/azure/sentinel/normalization-common-fields
 """
 
+import sys
+from itertools import chain
+
 # Valid ASIM field names for User/Account entities
 # These fields can have prefixes: Actor, Target, Src, Dst
 ASIM_USER_FIELDS = [
@@ -214,174 +217,172 @@ ASIM_PREFIXES = [
     "Remote",     # Remote endpoint
 ]
 
+# Commonly used standalone fields that take no prefix
+ASIM_STANDALONE_FIELDS = [
+    # Common standalone fields
+    "User",
+    "Computer",
+    "IpAddr",
+    "Hostname",
+    "Application",
+    
+    # Event fields
+    "EventType",
+    "EventResult",
+    "EventResultDetails",
+    "EventMessage",
+    "EventOriginalType",
+    "EventOriginalResultDetails",
+    
+    # HTTP/Web session fields
+    "HttpStatusCode",
+    "HttpRequestMethod",
+    "HttpVersion",
+    "HttpUserAgent",
+    "HttpReferrer",
+    "HttpContentType",
+    "HttpContentFormat",
+    
+    # Common Windows fields that may be used
+    "Account",
+    "AccountType",
+    "LogonType",
+    "SubjectUserName",
+    "SubjectUserSid",
+    "SubjectDomainName",
+    "TargetUserName",
+    "TargetUserSid",
+    "TargetDomainName",
+    "WorkstationName",
+    "ImpersonationLevel",
+    "PrivilegeList",
+    
+    # Rule/Alert fields
+    "RuleName",
+    "RuleNumber",
+    "AlertName",
+    "AlertSeverity",
+]
+
+# Base field groups that are valid as-is, without a prefix
+_UNPREFIXED_GROUPS = (
+    ASIM_REGISTRY_FIELDS,
+    ASIM_URL_FIELDS,
+    ASIM_EMAIL_FIELDS,
+    ASIM_DNS_FIELDS,
+    ASIM_NETWORK_FIELDS,
+    ASIM_THREAT_FIELDS,
+    ASIM_CLOUDAPP_FIELDS,
+    ASIM_STANDALONE_FIELDS,
+)
+
+# (prefixes, base fields) pairs; every prefix is combined with every base field
+_PREFIXED_EXPANSIONS = (
+    (("Actor", "Target", "Src", "Dst"), ASIM_USER_FIELDS),
+    (("Src", "Dst", "Dvc"), ASIM_HOST_FIELDS),
+    (("Acting", "Target", "Parent"), ASIM_PROCESS_FIELDS),
+    (("Target", "Src"), ASIM_FILE_FIELDS),
+    (("Acting", "Target"), ASIM_APPLICATION_FIELDS),
+    (("Src", "Dst"), ASIM_GEOLOCATION_FIELDS),
+    # Directional network fields
+    (("Src", "Dst"), ("PortNumber", "Bytes", "Packets", "VlanId")),
+    # Special VLAN fields
+    (("Inner", "Outer"), ("VlanId",)),
+)
+
+
 # Build comprehensive list of valid ASIM field names by combining prefixes with base field names
 def build_asim_field_list():
     """
     Build complete list of valid ASIM field names.
-    Returns a set of all valid field names including prefixed versions.
+    Returns a frozenset of all valid field names including prefixed versions.
     """
-    valid_fields = set()
-    
-    # Add unprefixed field names
-    valid_fields.update(ASIM_REGISTRY_FIELDS)
-    valid_fields.update(ASIM_URL_FIELDS)
-    valid_fields.update(ASIM_EMAIL_FIELDS)
-    valid_fields.update(ASIM_DNS_FIELDS)
-    valid_fields.update(ASIM_NETWORK_FIELDS)
-    valid_fields.update(ASIM_THREAT_FIELDS)
-    valid_fields.update(ASIM_CLOUDAPP_FIELDS)
-    
-    # Add User fields with common prefixes
-    for prefix in ["Actor", "Target", "Src", "Dst"]:
-        for field in ASIM_USER_FIELDS:
-            valid_fields.add(f"{prefix}{field}")
-    
-    # Add Host/Device fields with common prefixes
-    for prefix in ["Src", "Dst", "Dvc"]:
-        for field in ASIM_HOST_FIELDS:
-            valid_fields.add(f"{prefix}{field}")
-    
-    # Add Process fields with common prefixes
-    for prefix in ["Acting", "Target", "Parent"]:
-        for field in ASIM_PROCESS_FIELDS:
-            valid_fields.add(f"{prefix}{field}")
-    
-    # Add File fields with common prefixes
-    for prefix in ["Target", "Src"]:
-        for field in ASIM_FILE_FIELDS:
-            valid_fields.add(f"{prefix}{field}")
-    
-    # Add Application fields with common prefixes
-    for prefix in ["Acting", "Target"]:
-        for field in ASIM_APPLICATION_FIELDS:
-            valid_fields.add(f"{prefix}{field}")
-    
-    # Add GeoLocation fields with common prefixes
-    for prefix in ["Src", "Dst"]:
-        for field in ASIM_GEOLOCATION_FIELDS:
-            valid_fields.add(f"{prefix}{field}")
-    
-    # Add network fields with Src/Dst prefixes where applicable
-    for prefix in ["Src", "Dst"]:
-        valid_fields.add(f"{prefix}PortNumber")
-        valid_fields.add(f"{prefix}Bytes")
-        valid_fields.add(f"{prefix}Packets")
-        valid_fields.add(f"{prefix}VlanId")
-    
-    # Add special VLAN fields
-    valid_fields.add("InnerVlanId")
-    valid_fields.add("OuterVlanId")
-    
-    # Add commonly used standalone fields
-    valid_fields.update([
-        # Common standalone fields
-        "User",
-        "Computer",
-        "IpAddr",
-        "Hostname",
-        "Application",
-        
-        # Event fields
-        "EventType",
-        "EventResult",
-        "EventResultDetails",
-        "EventMessage",
-        "EventOriginalType",
-        "EventOriginalResultDetails",
-        
-        # HTTP/Web session fields
-        "HttpStatusCode",
-        "HttpRequestMethod",
-        "HttpVersion",
-        "HttpUserAgent",
-        "HttpReferrer",
-        "HttpContentType",
-        "HttpContentFormat",
-        
-        # Common Windows fields that may be used
-        "Account",
-        "AccountType",
-        "LogonType",
-        "SubjectUserName",
-        "SubjectUserSid",
-        "SubjectDomainName",
-        "TargetUserName",
-        "TargetUserSid",
-        "TargetDomainName",
-        "WorkstationName",
-        "ImpersonationLevel",
-        "PrivilegeList",
-        
-        # Rule/Alert fields
-        "RuleName",
-        "RuleNumber",
-        "AlertName",
-        "AlertSeverity",
-    ])
-    
-    return valid_fields
+    # Interned so membership tests against interned names compare by identity
+    return frozenset(map(sys.intern, chain(
+        chain.from_iterable(_UNPREFIXED_GROUPS),
+        (
+            f"{prefix}{field}"
+            for prefixes, fields in _PREFIXED_EXPANSIONS
+            for prefix in prefixes
+            for field in fields
+        ),
+    )))
 
 
-# Build the complete list on module import
-VALID_ASIM_FIELD_NAMES = build_asim_field_list()
+# The expanded field list is generated ahead of time by tools/gen_asim_fields.py
+# Re-run the generator after changing any of the tables above
+from ._asim_fields_generated import VALID_ASIM_FIELD_NAMES  # noqa: E402
 
 
 # Entity type to expected field patterns mapping
 # This helps provide more specific guidance in error messages
+# Every entry has all three keys, each a tuple (empty when not applicable)
 ENTITY_TO_ASIM_PATTERNS = {
     "Account": {
-        "prefixes": ["Actor", "Target", "Src", "Dst"],
-        "base_fields": ASIM_USER_FIELDS,
-        "examples": ["ActorUsername", "TargetUsername", "ActorUserId", "SrcUsername"]
+        "prefixes": ("Actor", "Target", "Src", "Dst"),
+        "base_fields": tuple(ASIM_USER_FIELDS),
+        "examples": ("ActorUsername", "TargetUsername", "ActorUserId", "SrcUsername")
     },
     "Host": {
-        "prefixes": ["Src", "Dst", "Dvc"],
-        "base_fields": ASIM_HOST_FIELDS,
-        "examples": ["SrcHostname", "DstHostname", "DvcIpAddr", "SrcIpAddr"]
+        "prefixes": ("Src", "Dst", "Dvc"),
+        "base_fields": tuple(ASIM_HOST_FIELDS),
+        "examples": ("SrcHostname", "DstHostname", "DvcIpAddr", "SrcIpAddr")
     },
     "IP": {
-        "prefixes": ["Src", "Dst", "Dvc"],
-        "base_fields": ["IpAddr"],
-        "examples": ["SrcIpAddr", "DstIpAddr", "DvcIpAddr"]
+        "prefixes": ("Src", "Dst", "Dvc"),
+        "base_fields": ("IpAddr",),
+        "examples": ("SrcIpAddr", "DstIpAddr", "DvcIpAddr")
     },
     "Process": {
-        "prefixes": ["Acting", "Target", "Parent"],
-        "base_fields": ASIM_PROCESS_FIELDS,
-        "examples": ["ActingProcessName", "TargetProcessId", "ActingProcessCommandLine"]
+        "prefixes": ("Acting", "Target", "Parent"),
+        "base_fields": tuple(ASIM_PROCESS_FIELDS),
+        "examples": ("ActingProcessName", "TargetProcessId", "ActingProcessCommandLine")
     },
     "File": {
-        "prefixes": ["Target", "Src"],
-        "base_fields": ASIM_FILE_FIELDS,
-        "examples": ["TargetFileName", "SrcFilePath", "TargetFileSHA256"]
+        "prefixes": ("Target", "Src"),
+        "base_fields": tuple(ASIM_FILE_FIELDS),
+        "examples": ("TargetFileName", "SrcFilePath", "TargetFileSHA256")
     },
     "URL": {
-        "prefixes": [],
-        "base_fields": ASIM_URL_FIELDS,
-        "examples": ["Url", "UrlHostname", "UrlCategory"]
+        "prefixes": (),
+        "base_fields": tuple(ASIM_URL_FIELDS),
+        "examples": ("Url", "UrlHostname", "UrlCategory")
     },
     "DNS": {
-        "prefixes": [],
-        "base_fields": ASIM_DNS_FIELDS,
-        "examples": ["DnsQuery", "DnsQueryType", "DnsResponseCode"]
+        "prefixes": (),
+        "base_fields": tuple(ASIM_DNS_FIELDS),
+        "examples": ("DnsQuery", "DnsQueryType", "DnsResponseCode")
     },
     "RegistryKey": {
-        "prefixes": [],
-        "base_fields": ASIM_REGISTRY_FIELDS,
-        "examples": ["RegistryKey", "RegistryValue", "RegistryValueType"]
+        "prefixes": (),
+        "base_fields": tuple(ASIM_REGISTRY_FIELDS),
+        "examples": ("RegistryKey", "RegistryValue", "RegistryValueType")
     },
     "RegistryValue": {
-        "prefixes": [],
-        "base_fields": ASIM_REGISTRY_FIELDS,
-        "examples": ["RegistryValue", "RegistryValueType", "RegistryValueData"]
+        "prefixes": (),
+        "base_fields": tuple(ASIM_REGISTRY_FIELDS),
+        "examples": ("RegistryValue", "RegistryValueType", "RegistryValueData")
     },
     "Malware": {
-        "prefixes": [],
-        "base_fields": ASIM_THREAT_FIELDS,
-        "examples": ["ThreatName", "ThreatCategory", "ThreatRiskLevel"]
+        "prefixes": (),
+        "base_fields": tuple(ASIM_THREAT_FIELDS),
+        "examples": ("ThreatName", "ThreatCategory", "ThreatRiskLevel")
     },
     "CloudApplication": {
-        "prefixes": [],
-        "base_fields": ASIM_CLOUDAPP_FIELDS,
-        "examples": ["CloudAppName", "CloudAppId", "CloudAppOperation"]
+        "prefixes": (),
+        "base_fields": tuple(ASIM_CLOUDAPP_FIELDS),
+        "examples": ("CloudAppName", "CloudAppId", "CloudAppOperation")
     },
 }
+
+
+# Every valid field name for each entity type, i.e. each prefix combined with
+# each base field (or the bare base fields for unprefixed entities)
+ENTITY_VALID_FIELDS = {
+    entity_type: frozenset(
+        f"{prefix}{base_field}"
+        for prefix in (pattern["prefixes"] or ("",))
+        for base_field in pattern["base_fields"]
+    )
+    for entity_type, pattern in ENTITY_TO_ASIM_PATTERNS.items()
+}
@@ -4,8 +4,8 @@ Defines strong identifiers for each entity type in Microsoft Sentinel.
 Reference: https://learn.microsoft.com/en-us/azure/sentinel/entities-reference
 """
 
-ENTITY_STRONG_IDENTIFIERS = {
-    "Account": [
+ENTITY_STRONG_IDENTIFIERS_ORDER = {
+    "Account": (
         "Name",
         "FullName",
         "NTDomain",
@@ -16,9 +16,9 @@ ENTITY_STRONG_IDENTIFIERS = {
         "AadTenantId",
         "ObjectGuid",
         "PUID"
-    ],
+    ),
     
-    "Host": [
+    "Host": (
         "FullName",
         "DnsDomain",
         "NTDomain",
@@ -28,79 +28,79 @@ ENTITY_STRONG_IDENTIFIERS = {
         "OMSAgentID",
         "OSFamily",
         "OSVersion"
-    ],
+    ),
     
-    "IP": [
-        "Address"
-    ],
+    "IP": (
+        "Address",
+    ),
     
-    "Malware": [
+    "Malware": (
         "Name",
         "Category"
-    ],
+    ),
     
-    "File": [
+    "File": (
         "Name",
         "Directory",
         "FileHashType",
         "FileHashValue"
-    ],
+    ),
     
-    "Process": [
+    "Process": (
         "ProcessId",
         "CommandLine",
         "ElevationToken",
         "CreationTimeUtc"
-    ],
+    ),
     
-    "CloudApplication": [
+    "CloudApplication": (
         "AppId",
         "Name",
         "InstanceName"
-    ],
+    ),
     
-    "DNS": [
-        "DomainName"
-    ],
+    "DNS": (
+        "DomainName",
+    ),
     
-    "AzureResource": [
-        "ResourceId"
-    ],
+    "AzureResource": (
+        "ResourceId",
+    ),
     
-    "FileHash": [
+    "FileHash": (
         "Algorithm",
         "Value"
-    ],
+    ),
     
-    "RegistryKey": [
+    "RegistryKey": (
         "Hive",
         "Key"
-    ],
+    ),
     
-    "RegistryValue": [
+    "RegistryValue": (
         "Name",
         "Value",
         "ValueType"
-    ],
+    ),
     
-    "SecurityGroup": [
+    "SecurityGroup": (
         "DistinguishedName",
         "SID",
         "ObjectGuid"
-    ],
+    ),
     
-    "URL": [
-        "Url"
-    ],
+    "URL": (
+        "Url",
+    ),
     
-    "IoTDevice": [
+    "IoTDevice": (
         "DeviceId",
         "DeviceName",
         "Source",
         "IoTSecurityAgentId"
-    ],
+    ),
     
-    "MailCluster": [
+    "MailCluster": (
         "NetworkMessageIds",
         "CountByDeliveryStatus",
         "CountByThreatType",
@@ -110,9 +110,9 @@ ENTITY_STRONG_IDENTIFIERS = {
         "QueryTime",
         "MailCount",
         "Source"
-    ],
+    ),
     
-    "MailMessage": [
+    "MailMessage": (
         "NetworkMessageId",
         "Recipient",
         "Urls",
@@ -125,21 +125,28 @@ ENTITY_STRONG_IDENTIFIERS = {
         "AntispamDirection",
         "DeliveryAction",
         "DeliveryLocation"
-    ],
+    ),
     
-    "Mailbox": [
+    "Mailbox": (
         "MailboxPrimaryAddress",
         "DisplayName",
         "Upn",
         "ExternalDirectoryObjectId"
-    ],
+    ),
     
-    "SubmissionMail": [
+    "SubmissionMail": (
         "SubmissionId",
         "Submitter",
         "NetworkMessageId",
         "Recipient",
         "Sender",
         "Subject"
-    ]
+    )
+}
+
+# Set form of each identifier list for membership checks; use
+# ENTITY_STRONG_IDENTIFIERS_ORDER where the documented order matters
+ENTITY_STRONG_IDENTIFIERS = {
+    entity_type: frozenset(identifiers)
+    for entity_type, identifiers in ENTITY_STRONG_IDENTIFIERS_ORDER.items()
 }
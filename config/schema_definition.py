@@ -3,8 +3,8 @@ Schema Definition
 Defines the expected schema structure and data types for Sentinel Analytics Rules.
 """
 
-# Required fields that must be present in every rule
-REQUIRED_FIELDS = [
+# Required fields that must be present in every rule, in reporting order
+REQUIRED_FIELDS_ORDER = (
     'id',
     'name',
     'kind',
@@ -21,7 +21,10 @@ REQUIRED_FIELDS = [
     'relevantTechniques',
     'eventGroupingSettings',
     'incidentConfiguration'
-]
+)
+
+# Set form of REQUIRED_FIELDS_ORDER for membership checks
+REQUIRED_FIELDS = frozenset(REQUIRED_FIELDS_ORDER)
 
 # Expected data types for fields
 # Format: 'field.path': expected_type
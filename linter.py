@@ -4,28 +4,33 @@ Sentinel Detection Linter
 Main entry point for validating Microsoft Sentinel Analytics Rules in YAML format.
 """
 
+import os
 import sys
 import argparse
+import functools
 import json
-import random
+import time
+from collections import OrderedDict
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict
-from datetime import datetime
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from colorama import init as colorama_init, Fore, Style
 
-from validators.guid_validator import GuidValidator
+from validators.guid_validator import GuidValidator, build_guid_index, install_guid_index
 from validators.schema_validator import SchemaValidator
 from validators.entity_validator import EntityValidator
 from validators.timing_validator import TimingValidator
 from validators.sentinel_constraints_validator import SentinelConstraintsValidator
 from validators.kql_validator import KQLValidator
-from utils.yaml_loader import load_yaml_file, YAMLLoadError
+from utils.yaml_loader import load_yaml_file, load_yaml_bytes, read_file_bytes, YAMLLoadError
 from utils.file_scanner import scan_yaml_files
+from utils.yaml_prefilter import is_probably_sentinel_rule
+from utils.result_cache import ResultCache, DEFAULT_CACHE_DIR, fingerprint_sources
 from config.schema_definition import SENTINEL_SCHEMA
 
 colorama_init(autoreset=True)
 
-AFFIRMATIONS = [
+AFFIRMATIONS = (
 "This looks like a great piece of work!",
 "Great job!",
 "This looks fantastic!",
@@ -122,13 +127,68 @@ AFFIRMATIONS = [
 "Your improvement curve is incredible!",
 "Great structure — future maintainers will thank you!",
 "That’s some elegant problem-solving!",
-"This is how you write detection logic that lasts!"
-"Wowzers"
-]
+"This is how you write detection logic that lasts!",
+"Wowzers",
+)
+
+@functools.lru_cache(maxsize=4096)
+def _cached_load(path_str: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Load a YAML file, memoized on its path and stat signature.
+    
+    mtime_ns and size are only part of the cache key, so an edited file
+    misses the cache and is parsed again.
+    """
+    return load_yaml_file(Path(path_str))
+
+
+def _load_rule(file_path: Path) -> Dict:
+    """Load a rule file, reusing the parsed data if the file is unchanged"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        # Let the loader report the problem with its usual message
+        return load_yaml_file(file_path)
+    return _cached_load(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_rule_bytes(file_path: Path):
+    """Return the raw bytes of a rule file, or None if it cannot be read"""
+    try:
+        return read_file_bytes(file_path)
+    except OSError:
+        return None  # The loader reports why when it tries again
+
+
+class Issue(NamedTuple):
+    """
+    A single error or warning, as compact as a plain tuple.
+    
+    Issues used to be dictionaries, so issue['message'] and issue.get('field')
+    still read the fields by name alongside issue.message.
+    """
+    validator: str
+    severity: str
+    message: str
+    field: Optional[str]
+    
+    def __getitem__(self, key):
+        if type(key) is str:
+            if key not in Issue._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def get(self, key: str, default=None):
+        """Return a field by name, or default if there is no such field"""
+        return getattr(self, key) if key in Issue._fields else default
+
 
 class ValidationResult:
     """Container for validation results"""
     
+    __slots__ = ('file_path', 'errors', 'warnings', 'passed')
+    
     def __init__(self, file_path: Path):
         self.file_path = file_path
         self.errors = []
@@ -137,22 +197,12 @@ class ValidationResult:
     
     def add_error(self, validator_name: str, message: str, field: str = None):
         """Add an error to the results"""
-        self.errors.append({
-            'validator': validator_name,
-            'severity': 'error',
-            'message': message,
-            'field': field
-        })
+        self.errors.append(Issue(validator_name, 'error', message, field))
         self.passed = False
     
     def add_warning(self, validator_name: str, message: str, field: str = None):
         """Add a warning to the results"""
-        self.warnings.append({
-            'validator': validator_name,
-            'severity': 'warning',
-            'message': message,
-            'field': field
-        })
+        self.warnings.append(Issue(validator_name, 'warning', message, field))
     
     def get_summary(self) -> Dict:
         """Get summary of validation results"""
@@ -162,37 +212,103 @@ class ValidationResult:
             'errors': len(self.errors),
             'warnings': len(self.warnings)
         }
+    
+    def as_dict(self) -> Dict:
+        """Get the full results, with each issue as a dictionary"""
+        keys = Issue._fields
+        return {
+            'file': str(self.file_path),
+            'status': 'passed' if self.passed else 'failed',
+            'errors': [dict(zip(keys, issue)) for issue in self.errors],
+            'warnings': [dict(zip(keys, issue)) for issue in self.warnings]
+        }
 
 
 class SentinelLinter:
     """Main linter orchestrator"""
     
-    def __init__(self, kql_schema: dict = None, enable_kql_validation: bool = True):
+    # Stateless validators, built once and shared by every linter in the process
+    _SHARED_VALIDATORS = None
+    
+    # KQL validators keyed by schema, so GlobalState is built once per schema;
+    # only the most recently used few are kept alive
+    _KQL_VALIDATORS = OrderedDict()
+    _MAX_KQL_VALIDATORS = 4
+    
+    def __init__(self, kql_schema: dict = None, enable_kql_validation: bool = True,
+                 cache_dir: Path = None, fail_fast: bool = False):
         """
         Initialize the linter with validators.
         
         Args:
             kql_schema: Optional schema configuration for KQL semantic validation
             enable_kql_validation: Whether to enable KQL validation (requires .NET)
+            cache_dir: Optional directory for caching results of unchanged files
+            fail_fast: Skip expensive validators (KQL) on rules that already have
+                GUID or schema errors
         """
-        self.validators = []
-        
         # Always-enabled validators
-        self.validators.append(GuidValidator())
-        self.validators.append(SchemaValidator())
-        self.validators.append(EntityValidator())
-        self.validators.append(TimingValidator())
-        self.validators.append(SentinelConstraintsValidator())
+        self.validators = list(self._shared_validators())
         
         # Optional KQL validator (may not be available if .NET not installed)
         self.kql_validator = None
         if enable_kql_validation:
             try:
-                self.kql_validator = KQLValidator(kql_schema)
+                self.kql_validator = self._kql_validator_for(kql_schema)
                 self.validators.append(self.kql_validator)
             except Exception as e:
                 print(f"WARNING: KQL validation disabled. Reason: {e}")
                 print("Install .NET SDK 6+ and build Kusto.Language.dll to enable KQL validation.")
+        
+        self.fail_fast = fail_fast
+        
+        # Optional on-disk result cache, invalidated by any code or config change
+        self.result_cache = None
+        if cache_dir is not None:
+            self.result_cache = ResultCache(cache_dir, self._cache_fingerprint(kql_schema))
+    
+    @classmethod
+    def _shared_validators(cls) -> tuple:
+        """Return the always-enabled validators, creating them on first use"""
+        if cls._SHARED_VALIDATORS is None:
+            cls._SHARED_VALIDATORS = (
+                GuidValidator(),
+                SchemaValidator(),
+                EntityValidator(),
+                TimingValidator(),
+                SentinelConstraintsValidator(),
+            )
+        return cls._SHARED_VALIDATORS
+    
+    @classmethod
+    def _kql_validator_for(cls, kql_schema: dict) -> KQLValidator:
+        """Return a KQL validator for the schema, reusing one built for an equal schema"""
+        key = json.dumps(kql_schema, sort_keys=True, default=str)
+        validators = cls._KQL_VALIDATORS
+        validator = validators.get(key)
+        if validator is None:
+            validator = validators[key] = KQLValidator(kql_schema)
+            if len(validators) > cls._MAX_KQL_VALIDATORS:
+                validators.popitem(last=False)
+        else:
+            validators.move_to_end(key)
+        return validator
+    
+    def _cache_fingerprint(self, kql_schema: dict) -> str:
+        """Fingerprint everything besides the file itself that affects its results"""
+        root = Path(__file__).resolve().parent
+        sources = [root / 'linter.py', root / 'utils' / 'yaml_loader.py']
+        sources.extend((root / 'validators').glob('*.py'))
+        sources.extend((root / 'config').glob('*.py'))
+        if self.kql_validator is not None:
+            # setup.py rebuilds the DLL from upstream sources, which can change KQL diagnostics
+            dll_path = self.kql_validator._find_dll_path()
+            if dll_path is not None:
+                sources.append(dll_path)
+        
+        validator_names = ','.join(type(v).__name__ for v in self.validators)
+        schema = json.dumps(kql_schema, sort_keys=True, default=str)
+        return fingerprint_sources(sources, validator_names, schema)
     
     def validate_file(self, file_path: Path, all_yaml_files: List[Path] = None) -> ValidationResult:
         """
@@ -207,9 +323,17 @@ class SentinelLinter:
         """
         result = ValidationResult(file_path)
         
+        # With a result cache the file is read once and the same bytes are
+        # both hashed for the cache key and parsed
+        cache = self.result_cache
+        content = _read_rule_bytes(file_path) if cache is not None else None
+        
         # Load YAML file
         try:
-            rule_data = load_yaml_file(file_path)
+            if content is not None:
+                rule_data = load_yaml_bytes(content, file_path)
+            else:
+                rule_data = _load_rule(file_path)
         except YAMLLoadError as e:
             result.add_error('YAML Parser', str(e))
             return result
@@ -217,36 +341,98 @@ class SentinelLinter:
             result.add_error('File Loader', f'Failed to load file: {str(e)}')
             return result
         
-        # Run all validators
-        for validator in self.validators:
-            try:
-                errors = validator.validate(rule_data, file_path, all_yaml_files)
-                
-                for error in errors:
-                    severity = error.get('severity', 'error').lower()
-                    validator_name = validator.validator_name
-                    message = error.get('message', 'Unknown error')
-                    field = error.get('field')
-                    
-                    if severity == 'warning':
-                        result.add_warning(validator_name, message, field)
-                    else:
-                        result.add_error(validator_name, message, field)
-                        
-            except Exception as e:
-                result.add_error(
-                    validator.validator_name,
-                    f'Validator crashed: {str(e)}'
-                )
+        # Cached entries hold one issue list per cacheable validator
+        cache_key = cache.key_for(content) if content is not None else None
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None and len(cached) != len(self.validators):
+            cached = None
+        
+        add_error = result.add_error
+        add_warning = result.add_warning
+        intern = sys.intern
+        entry = []
+        # A new entry is written on a miss, or when a validator ran for a slot
+        # the entry left empty (e.g. skipped by an earlier --fail-fast run)
+        dirty = cached is None
+        fail_fast = self.fail_fast
+        # Name of the validator whose errors mean expensive checks are skipped
+        stopped_by = None
+        
+        # Run all validators, cheapest first
+        for idx, validator in enumerate(self.validators):
+            validator_name = validator.validator_name
+            
+            if stopped_by is not None and validator.expensive:
+                # Depends on another validator's outcome, so never cached; an
+                # earlier full run's result is kept
+                issues = [('warning', f'Skipped: {stopped_by} reported errors', None)]
+                entry.append(cached[idx] if cached is not None else None)
+            else:
+                if cached is not None and validator.cacheable and cached[idx] is not None:
+                    issues = cached[idx]
+                else:
+                    issues = self._run_validator(validator, rule_data, file_path, all_yaml_files)
+                    dirty = dirty or validator.cacheable
+                entry.append(issues if validator.cacheable else None)
+            
+            for severity, message, field in issues:
+                # Field paths come from a small vocabulary but are often built
+                # per issue (or decoded from the cache); share one copy of each
+                if type(field) is str:
+                    field = intern(field)
+                if severity == 'warning':
+                    add_warning(validator_name, message, field)
+                else:
+                    add_error(validator_name, message, field)
+                    if stopped_by is None and fail_fast and validator.stops_pipeline_on_error:
+                        stopped_by = validator_name
+        
+        if cache_key is not None and dirty:
+            cache.put(cache_key, entry)
         
         return result
     
-    def validate_directory(self, directory: Path) -> List[ValidationResult]:
+    def _run_validator(self, validator, rule_data: dict, file_path: Path,
+                       all_yaml_files: List[Path]) -> List[tuple]:
+        """Run one validator, returning its issues as (severity, message, field) tuples"""
+        missing = validator.requires - rule_data.keys()
+        if missing:
+            # The missing fields are already reported by the schema validator
+            return [(
+                'warning',
+                f"Skipped: prerequisite field(s) missing: {', '.join(sorted(missing))}",
+                None
+            )]
+        
+        issues = []
+        try:
+            errors = validator.validate(rule_data, file_path, all_yaml_files)
+            
+            for error in errors:
+                severity = error.get('severity', 'error').lower()
+                message = error.get('message', 'Unknown error')
+                field = error.get('field')
+                
+                issues.append(('warning' if severity == 'warning' else 'error', message, field))
+                
+        except Exception as e:
+            issues.append(('error', f'Validator crashed: {str(e)}', None))
+        
+        return issues
+    
+    def validate_directory(self, directory: Path, max_workers: int = None,
+                           skip_non_rules: bool = False) -> List[ValidationResult]:
         """
         Validate all YAML files in a directory.
         
+        Files are validated in parallel: across processes when KQL validation
+        is off, or across threads sharing this linter when it is on.
+        
         Args:
             directory: Path to directory containing YAML files
+            max_workers: Maximum number of parallel workers (default: CPU count)
+            skip_non_rules: Skip files that do not look like analytics rules
+                without parsing them, reporting a warning for each
         
         Returns:
             List of ValidationResult objects
@@ -257,11 +443,67 @@ class SentinelLinter:
             print(f"No YAML files found in {directory}")
             return []
         
-        results = []
+        skipped = []
+        if skip_non_rules:
+            rule_files = []
+            for file_path in yaml_files:
+                (rule_files if is_probably_sentinel_rule(file_path) else skipped).append(file_path)
+            yaml_files = rule_files
+        
+        results = self._validate_files(yaml_files, max_workers)
+        
+        if skipped:
+            for file_path in skipped:
+                result = ValidationResult(file_path)
+                result.add_warning(
+                    'File Scanner',
+                    'Skipped: file does not look like an analytics rule '
+                    '(fewer than two of the top-level keys id, name, kind)'
+                )
+                results.append(result)
+            # Restore scan order, which is sorted by path
+            results.sort(key=lambda r: r.file_path)
+        
+        return results
+    
+    def _validate_files(self, yaml_files: List[Path], max_workers: int = None) -> List[ValidationResult]:
+        """Validate the given files in parallel, returning results in the same order"""
         total = len(yaml_files)
+        workers = min(max_workers or os.cpu_count() or 1, total)
+        # One tuple for the whole run lets the GUID validator recognize it by identity
+        yaml_files = tuple(yaml_files)
+        
+        if workers <= 1:
+            validated = (self.validate_file(file_path, yaml_files) for file_path in yaml_files)
+            return self._collect_results(validated, total)
+        
+        # Only parallel runs pay for importing the pool machinery; single-file
+        # runs such as the pre-commit hook start faster without it
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        
+        if self.kql_validator is not None:
+            # The .NET interop handle cannot be pickled, so share this linter across threads
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                validated = executor.map(self.validate_file, yaml_files, repeat(yaml_files))
+                return self._collect_results(validated, total)
+        
+        # Hand workers this linter, the file list and the GUID index once, rather
+        # than per task; with fork all three are inherited copy-on-write instead
+        # of being pickled, and no worker rebuilds the index on its own
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(self, yaml_files, build_guid_index(yaml_files))
+        ) as executor:
+            validated = executor.map(_validate_one, yaml_files, chunksize=8)
+            return self._collect_results(validated, total)
+    
+    def _collect_results(self, validated, total: int) -> List[ValidationResult]:
+        """Gather results in file order, printing progress along the way"""
+        results = []
     #  Simple progress output to avoid silent hangs
-        for idx, file_path in enumerate(yaml_files, start=1):
-            result = self.validate_file(file_path, yaml_files)
+        for idx, result in enumerate(validated, start=1):
             results.append(result)
             # print occasional progress so console isn't silent for long runs
             if idx % 10 == 0 or idx == total:
@@ -269,21 +511,67 @@ class SentinelLinter:
         return results
 
 
+# Worker process state, installed once per worker by the pool initializer
+_WORKER_LINTER = None
+_WORKER_ALL_FILES = None
+
+
+def _pool_context():
+    """Use fork where it is safe so workers inherit the parent's state"""
+    import multiprocessing
+    if sys.platform != 'darwin' and 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None  # Platform default (spawn)
+
+
+def _init_worker(linter: 'SentinelLinter', all_yaml_files: Tuple[Path, ...], guid_index: tuple):
+    """Pool initializer: install the parent's linter, the scanned file list and its GUID index"""
+    global _WORKER_LINTER, _WORKER_ALL_FILES
+    _WORKER_LINTER = linter
+    _WORKER_ALL_FILES = all_yaml_files
+    install_guid_index(guid_index)
+
+
+def _validate_one(file_path: Path) -> ValidationResult:
+    """Validate a single file inside a worker process"""
+    return _WORKER_LINTER.validate_file(file_path, _WORKER_ALL_FILES)
+
+
+def _summarize(results: List[ValidationResult]) -> Dict:
+    """Count files and issues across all results in a single pass"""
+    _len = len
+    passed = total_errors = total_warnings = 0
+    for r in results:
+        passed += r.passed
+        total_errors += _len(r.errors)
+        total_warnings += _len(r.warnings)
+    
+    return {
+        'total_files': _len(results),
+        'passed': passed,
+        'failed': _len(results) - passed,
+        'total_errors': total_errors,
+        'total_warnings': total_warnings
+    }
+
+
 def print_console_output(results: List[ValidationResult], verbose: bool = False):
     """Print validation results to console"""
     
-    total_files = len(results)
-    passed_files = sum(1 for r in results if r.passed)
-    failed_files = total_files - passed_files
-    total_errors = sum(len(r.errors) for r in results)
-    total_warnings = sum(len(r.warnings) for r in results)
+    summary = _summarize(results)
+    total_files = summary['total_files']
+    passed_files = summary['passed']
+    failed_files = summary['failed']
+    total_errors = summary['total_errors']
+    total_warnings = summary['total_warnings']
     
     print("\n" + "="*70)
     print("SENTINEL DETECTION LINTER - VALIDATION RESULTS")
     print("="*70 + "\n")
     
-    # Add random affirmation with 1/5 chance
-    if random.randint(1, 5) == 1:
+    # Add random affirmation with 1/5 chance (random is only needed here)
+    import random
+    if random.random() < 0.2:
         print(f"\n💫💫💫💫 {random.choice(AFFIRMATIONS)} 💫💫💫💫\n")
     
     for result in results:
@@ -295,17 +583,15 @@ def print_console_output(results: List[ValidationResult], verbose: bool = False)
         print(f"\n {status_token} {Fore.YELLOW}{result.file_path.name}{Style.RESET_ALL}")
         
         # Print errors
-        for error in result.errors:
-            field = error.get('field', '')
-            field_str = f" ({field})" if field else ""
-            print(f"\n  {Fore.RED}[ERROR]{Style.RESET_ALL} {Fore.BLUE}{error['validator']}{Style.RESET_ALL}: {error['message']}{Fore.YELLOW}{field_str}{Style.RESET_ALL}")
+        for issue in result.errors:
+            field_str = f" ({issue.field})" if issue.field else ""
+            print(f"\n  {Fore.RED}[ERROR]{Style.RESET_ALL} {Fore.BLUE}{issue.validator}{Style.RESET_ALL}: {issue.message}{Fore.YELLOW}{field_str}{Style.RESET_ALL}")
         
         # Print warnings if verbose
         if verbose:
-            for warning in result.warnings:
-                field = warning.get('field', '')
-                field_str = f" ({field})" if field else ""
-                print(f"  [WARNING] {warning['validator']}: {warning['message']}{field_str}")
+            for issue in result.warnings:
+                field_str = f" ({issue.field})" if issue.field else ""
+                print(f"  [WARNING] {issue.validator}: {issue.message}{field_str}")
     
     # Print summary
     print("\n" + "-"*70)
@@ -316,36 +602,43 @@ def print_console_output(results: List[ValidationResult], verbose: bool = False)
     return failed_files == 0
 
 
+# json.dumps builds a new encoder per call when indent is given; records reuse one
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
 def print_json_output(results: List[ValidationResult]):
-    """Print validation results as JSON"""
-    
-    output = {
-        'timestamp': datetime.utcnow().isoformat() + 'Z',
-        'summary': {
-            'total_files': len(results),
-            'passed': sum(1 for r in results if r.passed),
-            'failed': sum(1 for r in results if not r.passed),
-            'total_errors': sum(len(r.errors) for r in results),
-            'total_warnings': sum(len(r.warnings) for r in results)
-        },
-        'results': []
+    """
+    Print validation results as JSON.
+    
+    Records are written one at a time rather than building the whole document
+    in memory; the output is identical to json.dumps(output, indent=2).
+    """
+    
+    summary = _summarize(results)
+    header = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'summary': summary
     }
     
+    write = sys.stdout.write
+    encode = _JSON_ENCODER.encode
+    # Reopen the header object and append the results array to it
+    write(encode(header)[:-2])
+    write(',\n  "results": [')
+    
+    separator = '\n    '
     for result in results:
-        output['results'].append({
-            'file': str(result.file_path),
-            'status': 'passed' if result.passed else 'failed',
-            'errors': result.errors,
-            'warnings': result.warnings
-        })
+        write(separator)
+        write(encode(result.as_dict()).replace('\n', '\n    '))
+        separator = ',\n    '
     
-    print(json.dumps(output, indent=2))
+    write('\n  ]\n}\n' if results else ']\n}\n')
     
-    return output['summary']['failed'] == 0
+    return summary['failed'] == 0
 
 
-def main():
-    """Main entry point"""
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
     
     parser = argparse.ArgumentParser(
         description='Validate Microsoft Sentinel Analytics Rules in YAML format',
@@ -366,6 +659,12 @@ Examples:
   
   Disable KQL validation:
     python linter.py detection.yaml --no-kql-validation
+  
+  Cache results of unchanged files between runs:
+    python linter.py --directory ./detections/ --cache
+  
+  Skip pipeline and other non-rule YAML files in a directory:
+    python linter.py --directory ./detections/ --skip-non-rules
         """
     )
     
@@ -407,6 +706,38 @@ Examples:
         help='Path to custom schema configuration JSON file'
     )
     
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        type=Path,
+        const=DEFAULT_CACHE_DIR,
+        metavar='DIR',
+        help=f'Reuse results for unchanged files, stored in DIR (default: {DEFAULT_CACHE_DIR})'
+    )
+    
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Skip KQL validation for rules that already have GUID or schema errors'
+    )
+    
+    parser.add_argument(
+        '--skip-non-rules',
+        action='store_true',
+        help='With --directory, skip YAML files that do not look like analytics rules'
+    )
+    
+    return parser
+
+
+# Built once at import rather than on every call to main()
+_ARG_PARSER = _build_arg_parser()
+
+
+def main():
+    """Main entry point"""
+    
+    parser = _ARG_PARSER
     args = parser.parse_args()
     
     # Validate arguments
@@ -428,7 +759,8 @@ Examples:
     
     # Initialize linter
     enable_kql = not args.no_kql_validation
-    linter = SentinelLinter(kql_schema=kql_schema, enable_kql_validation=enable_kql)
+    linter = SentinelLinter(kql_schema=kql_schema, enable_kql_validation=enable_kql,
+                            cache_dir=args.cache, fail_fast=args.fail_fast)
     
     # Validate files
     results = []
@@ -449,7 +781,7 @@ Examples:
         if not args.directory.exists():
             print(f"ERROR: Directory not found: {args.directory}")
             return 1
-        results = linter.validate_directory(args.directory)
+        results = linter.validate_directory(args.directory, skip_non_rules=args.skip_non_rules)
     
     # Output results
     if args.output == 'json':
@@ -54,6 +54,17 @@ class SetupManager:
             print("  Download from: https://dotnet.microsoft.com/download")
             return False
         
+        # Check for the libyaml-backed YAML loader (optional, but much faster)
+        try:
+            import yaml
+            if hasattr(yaml, 'CSafeLoader'):
+                print(f"  [OK] PyYAML {yaml.__version__} with libyaml")
+            else:
+                print(f"  [WARNING] PyYAML {yaml.__version__} was built without libyaml; "
+                      "YAML files will load with the slower pure-Python parser")
+        except ImportError:
+            print("  [WARNING] PyYAML is not installed. Install with: pip install -r requirements.txt")
+        
         print("\nAll prerequisites met!\n")
         return True
     
@@ -72,8 +83,9 @@ class SetupManager:
         try:
             # Clone the repository
             print("Cloning Kusto-Query-Language repository...")
+            # Only the latest sources are needed, so skip the history
             subprocess.run([
-                'git', 'clone',
+                'git', 'clone', '--depth', '1',
                 'https://github.com/microsoft/Kusto-Query-Language.git',
                 str(self.temp_dir)
             ], check=True)
@@ -0,0 +1,59 @@
+"""
+Result cache tests
+Run with: python -m unittest discover tests
+"""
+
+import multiprocessing
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import linter
+from utils.result_cache import ResultCache
+
+
+class ResultCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.rules = self.tmp / 'rules'
+        shutil.copytree(ROOT / 'examples', self.rules, ignore=shutil.ignore_patterns('*.sh', '*.json'))
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+    
+    def test_cache_survives_pickling(self):
+        cache = ResultCache(self.tmp / 'cache', 'fingerprint')
+        cache.put('abcd', [[['error', 'message', None]]])
+        
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(copy.fingerprint, 'fingerprint')
+        self.assertEqual(copy.key_for(b'rule'), cache.key_for(b'rule'))
+        self.assertEqual(copy.get('abcd'), [[['error', 'message', None]]])
+    
+    def test_spawned_pool_with_cache(self):
+        def summaries(results):
+            return [(r.get_summary(), r.as_dict()) for r in results]
+        
+        expected = summaries(
+            linter.SentinelLinter(enable_kql_validation=False).validate_directory(self.rules, max_workers=1)
+        )
+        
+        cached_linter = linter.SentinelLinter(enable_kql_validation=False, cache_dir=self.tmp / 'cache')
+        with mock.patch.object(linter, '_pool_context', lambda: multiprocessing.get_context('spawn')):
+            for _ in range(2):  # Cold, then warm
+                results = cached_linter.validate_directory(self.rules, max_workers=3)
+                self.assertEqual(summaries(results), expected)
+        
+        self.assertTrue(list((self.tmp / 'cache').glob('*/*.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Generate config/_asim_fields_generated.py
+
+Expands the ASIM prefix/base field tables in config/asim_field_names.py into a
+frozen literal so the linter does not rebuild the set on every import.
+
+Run from the repository root after editing the ASIM field tables:
+    python tools/gen_asim_fields.py
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from config.asim_field_names import build_asim_field_list  # noqa: E402
+
+OUTPUT_PATH = REPO_ROOT / 'config' / '_asim_fields_generated.py'
+
+HEADER = '''"""
+Generated ASIM field names - DO NOT EDIT
+Produced by tools/gen_asim_fields.py from the tables in asim_field_names.py.
+"""
+
+'''
+
+
+def render(field_names) -> str:
+    """Render the generated module source for the given field names."""
+    lines = [HEADER, 'VALID_ASIM_FIELD_NAMES = frozenset((\n']
+    lines.extend(f'    {name!r},\n' for name in sorted(field_names))
+    lines.append('))\n')
+    return ''.join(lines)
+
+
+def main() -> int:
+    field_names = build_asim_field_list()
+    OUTPUT_PATH.write_text(render(field_names), encoding='utf-8', newline='\n')
+    print(f"Wrote {len(field_names)} field names to {OUTPUT_PATH.relative_to(REPO_ROOT)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,11 +2,22 @@
 Utilities package for Sentinel Detection Linter
 """
 
-from .yaml_loader import load_yaml_file, YAMLLoadError
-from .file_scanner import scan_yaml_files
+from .yaml_loader import load_yaml_file, load_yaml_bytes, read_file_bytes, YAMLLoadError
+from .file_scanner import scan_yaml_files, iter_yaml_files
+from .yaml_prefilter import is_probably_sentinel_rule
+from .retry import call_with_retry
+from .result_cache import ResultCache, DEFAULT_CACHE_DIR, fingerprint_sources
 
 __all__ = [
     'load_yaml_file',
+    'load_yaml_bytes',
+    'read_file_bytes',
     'YAMLLoadError',
-    'scan_yaml_files'
+    'scan_yaml_files',
+    'iter_yaml_files',
+    'is_probably_sentinel_rule',
+    'call_with_retry',
+    'ResultCache',
+    'DEFAULT_CACHE_DIR',
+    'fingerprint_sources'
 ]
@@ -3,8 +3,46 @@ File Scanner
 Scans directories for YAML files.
 """
 
+import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Union
+
+YAML_EXTENSIONS = ('.yaml', '.yml')
+
+
+def _iter_yaml_paths(directory: Union[Path, str], recursive: bool) -> Iterator[str]:
+    """Yield YAML file path strings using a single scandir per directory"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            yield from _iter_yaml_paths(entry.path, recursive)
+                    elif os.path.normcase(entry.name).endswith(YAML_EXTENSIONS) and entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue  # Entry vanished or cannot be inspected
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        return  # Unreadable directories are skipped, as with Path.rglob
+
+
+def iter_yaml_files(directory: Union[Path, str], recursive: bool = True) -> Iterator[Path]:
+    """
+    Yield YAML files under directory as they are found.
+    
+    Files come in directory order rather than sorted, so callers can start
+    on the first files before the walk has finished. Use scan_yaml_files
+    when a deterministic order is needed.
+    
+    Args:
+        directory: Directory to scan
+        recursive: Whether to scan subdirectories recursively
+    
+    Yields:
+        Path objects for YAML files
+    """
+    return map(Path, _iter_yaml_paths(directory, recursive))
 
 
 def scan_yaml_files(directory: Path, recursive: bool = True) -> List[Path]:
@@ -18,18 +56,8 @@ def scan_yaml_files(directory: Path, recursive: bool = True) -> List[Path]:
     Returns:
         List of Path objects for YAML files
     """
-    yaml_files = []
-    
-    if recursive:
-        # Recursively find all YAML files
-        yaml_files.extend(directory.rglob('*.yaml'))
-        yaml_files.extend(directory.rglob('*.yml'))
-    else:
-        # Only search immediate directory
-        yaml_files.extend(directory.glob('*.yaml'))
-        yaml_files.extend(directory.glob('*.yml'))
-    
     # Sort for consistent ordering
+    yaml_files = list(iter_yaml_files(directory, recursive))
     yaml_files.sort()
     
     return yaml_files
@@ -0,0 +1,115 @@
+"""
+Result Cache
+Caches per-file validation results on disk, keyed by file content.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+DEFAULT_CACHE_DIR = Path('.sentinel-linter-cache')
+
+# Recently used entries kept in memory so re-scans in one run skip the disk
+_MEMORY_ENTRIES = 512
+
+
+def fingerprint_sources(paths: Iterable[Union[Path, str]], *extra: str) -> str:
+    """
+    Build a fingerprint from source files and extra configuration strings.
+
+    Any change to the linter's code or configuration changes the fingerprint,
+    which in turn invalidates every cached result.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(str(p) for p in paths):
+        digest.update(path.encode('utf-8'))
+        try:
+            digest.update(Path(path).read_bytes())
+        except OSError:
+            digest.update(b'<missing>')
+    for value in extra:
+        digest.update(b'\0' + value.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed store of validation results.
+
+    Entries are keyed by a hash of the file bytes plus a fingerprint of the
+    linter configuration, so an entry can never be stale: editing the file or
+    the linter simply produces a different key.
+    """
+
+    def __init__(self, cache_dir: Union[Path, str], fingerprint: str):
+        self.cache_dir = Path(cache_dir)
+        self.fingerprint = fingerprint
+        # blake2b keys are limited to 64 bytes, so key on a digest of the fingerprint
+        self._hash_key = hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=32).digest()
+        self._memory = OrderedDict()
+        # KQL runs share one cache across threads; reordering and eviction
+        # must not interleave, or move_to_end can miss an evicted key
+        self._memory_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks cannot be pickled, so spawned pool workers get the settings
+        # and start with an empty memory of their own
+        return {'cache_dir': self.cache_dir, 'fingerprint': self.fingerprint}
+
+    def __setstate__(self, state):
+        self.__init__(state['cache_dir'], state['fingerprint'])
+
+    def key_for(self, content: bytes) -> str:
+        """Return the cache key for a file's raw contents"""
+        return hashlib.blake2b(content, digest_size=16, key=self._hash_key).hexdigest()
+    
+    def get(self, key: str) -> Optional[List]:
+        """Return the cached entry for key, or None on a miss"""
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None  # Missing or unreadable entries are plain misses
+
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: List):
+        """Store an entry; failures to write are ignored"""
+        self._remember(key, entry)
+
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / (key[2:] + '.json')
+
+    def _remember(self, key: str, entry: List):
+        with self._memory_lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            if len(self._memory) > _MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
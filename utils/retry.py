@@ -0,0 +1,46 @@
+"""
+Retry Helpers
+Retries file operations that fail while another process briefly holds the file.
+"""
+
+import sys
+import time
+from typing import Callable, Tuple, Type, TypeVar
+
+T = TypeVar('T')
+
+# Only Windows refuses access to files that antivirus, indexers or editors
+# have open; elsewhere a PermissionError is permanent and is raised at once
+RETRY_ENABLED = sys.platform == 'win32'
+
+# Seconds to wait before each retry
+RETRY_DELAYS = (0.5, 1.0, 2.0)
+
+
+def call_with_retry(fn: Callable[..., T], *args,
+                    retry_on: Tuple[Type[BaseException], ...] = (PermissionError,),
+                    delays: Tuple[float, ...] = RETRY_DELAYS, **kwargs) -> T:
+    """
+    Call fn, retrying with backoff while it raises one of retry_on.
+    
+    Retries only happen on Windows. The last failure is re-raised once the
+    delays are used up. Errors that retrying cannot fix, such as
+    FileNotFoundError, should not be listed in retry_on.
+    
+    Args:
+        fn: Function to call
+        *args: Positional arguments for fn
+        retry_on: Exception types that indicate a transient failure
+        delays: Seconds to wait before each retry
+        **kwargs: Keyword arguments for fn
+    
+    Returns:
+        Whatever fn returns
+    """
+    if RETRY_ENABLED:
+        for delay in delays:
+            try:
+                return fn(*args, **kwargs)
+            except retry_on:
+                time.sleep(delay)
+    return fn(*args, **kwargs)
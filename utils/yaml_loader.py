@@ -3,16 +3,44 @@ YAML Loader
 Safely loads and parses YAML files.
 """
 
+import errno
+import io
+import os
+import stat
 import yaml
 from pathlib import Path
 from typing import Dict, Union
 
+from .retry import call_with_retry
+
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only ship
+# the pure-Python one, which is much slower but produces the same data
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Binary mode matters on Windows, where os.open would otherwise translate newlines
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
 
 class YAMLLoadError(Exception):
     """Custom exception for YAML loading errors"""
     pass
 
 
+def _resolve(file_path: Union[Path, str]) -> Path:
+    # Ensure we have a Path object for consistent handling
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
+    
+    # Resolve to absolute path for better error messages and cross-platform compatibility
+    try:
+        return file_path.resolve()
+    except (OSError, RuntimeError) as e:
+        raise YAMLLoadError(f"Cannot resolve path {file_path}: {str(e)}")
+
+
 def load_yaml_file(file_path: Union[Path, str]) -> Dict:
     """
     Safely load a YAML file.
@@ -26,19 +54,93 @@ def load_yaml_file(file_path: Union[Path, str]) -> Dict:
     Raises:
         YAMLLoadError: If the file cannot be loaded or parsed
     """
-    # Ensure we have a Path object for consistent handling
-    if not isinstance(file_path, Path):
-        file_path = Path(file_path)
+    file_path = _resolve(file_path)
     
-    # Resolve to absolute path for better error messages and cross-platform compatibility
     try:
-        file_path = file_path.resolve()
-    except (OSError, RuntimeError) as e:
-        raise YAMLLoadError(f"Cannot resolve path {file_path}: {str(e)}")
+        content = read_file_bytes(file_path)
+    
+    except FileNotFoundError:
+        raise YAMLLoadError(f"File not found: {file_path}")
+    
+    except PermissionError:
+        raise YAMLLoadError(f"Permission denied reading file: {file_path}")
+    
+    except Exception as e:
+        raise YAMLLoadError(f"Error loading YAML file: {str(e)}")
+    
+    return _parse_yaml(content, file_path)
+
+
+def read_file_bytes(file_path: Union[Path, str]) -> bytes:
+    """
+    Read the raw bytes of a file, as load_yaml_file does.
+    
+    Files briefly locked by other processes on Windows are retried, and a
+    directory raises IsADirectoryError on every platform.
+    
+    Raises:
+        OSError: If the file cannot be read
+    """
+    return call_with_retry(_read_bytes, file_path)
+
+
+def _read_bytes(file_path: Union[Path, str]) -> bytes:
+    # A raw descriptor and a single read sized from fstat skip the buffered
+    # file object, which gains nothing on files of a few KB
+    fd = os.open(file_path, _OPEN_FLAGS)
+    try:
+        file_stat = os.fstat(fd)
+        if stat.S_ISDIR(file_stat.st_mode):
+            # Match what open() reports for a directory
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), str(file_path))
+        
+        # Ask for one byte more than the size so a complete read is recognized
+        data = os.read(fd, file_stat.st_size + 1)
+        if len(data) == file_stat.st_size:
+            return data
+        
+        # A short read (network filesystems, or the ~2 GiB cap on one read), a
+        # file that grew after fstat, or one that does not report a size; read
+        # the rest until end of file
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def load_yaml_bytes(content: bytes, file_path: Union[Path, str]) -> Dict:
+    """
+    Safely parse YAML that has already been read from file_path.
+    
+    Lets callers that need the raw bytes anyway (e.g. to hash them) avoid
+    reading the file a second time. Errors are reported exactly as
+    load_yaml_file would report them.
+    
+    Args:
+        content: Raw file contents
+        file_path: Path the contents were read from, used in error messages
+    
+    Returns:
+        Parsed YAML data as dictionary
+    
+    Raises:
+        YAMLLoadError: If the contents cannot be parsed
+    """
+    return _parse_yaml(content, _resolve(file_path))
+
+
+def _parse_yaml(content: bytes, file_path: Path) -> Dict:
+    # Hand the loader raw bytes; it detects the encoding and decodes itself.
+    # The stream is named after the file so reader errors still mention it.
+    stream = io.BytesIO(content)
+    stream.name = str(file_path)
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(stream, Loader=SafeLoader)
         
         if data is None:
             raise YAMLLoadError(f"File is empty or contains only comments: {file_path}")
@@ -50,6 +152,17 @@ def load_yaml_file(file_path: Union[Path, str]) -> Dict:
         
         return data
     
+    except yaml.reader.ReaderError as e:
+        # The reader reports both undecodable bytes and disallowed characters;
+        # only the former is an encoding problem
+        try:
+            content.decode('utf-8')
+        except UnicodeDecodeError as decode_error:
+            raise YAMLLoadError(
+                f"File encoding error: {file_path}. Expected UTF-8 encoding. {str(decode_error)}"
+            )
+        raise YAMLLoadError(f"YAML parsing error: {str(e)}")
+    
     except yaml.YAMLError as e:
         # Parse YAML-specific errors
         if hasattr(e, 'problem_mark'):
@@ -60,12 +173,6 @@ def load_yaml_file(file_path: Union[Path, str]) -> Dict:
         else:
             raise YAMLLoadError(f"YAML parsing error: {str(e)}")
     
-    except FileNotFoundError:
-        raise YAMLLoadError(f"File not found: {file_path}")
-    
-    except PermissionError:
-        raise YAMLLoadError(f"Permission denied reading file: {file_path}")
-    
     except UnicodeDecodeError as e:
         raise YAMLLoadError(
             f"File encoding error: {file_path}. Expected UTF-8 encoding. {str(e)}"
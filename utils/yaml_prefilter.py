@@ -0,0 +1,42 @@
+"""
+YAML Prefilter
+Cheaply recognizes YAML files that cannot be Sentinel analytics rules.
+"""
+
+import re
+from pathlib import Path
+from typing import Union
+
+# Rules put their top-level keys near the start, so the head of the file is enough
+SNIFF_BYTES = 4096
+
+# Unindented id/name/kind keys, optionally quoted and after a UTF-8 BOM
+_RULE_KEY_PATTERN = re.compile(rb'^(?:\xef\xbb\xbf)?["\']?(id|name|kind)["\']?[ \t]*:', re.MULTILINE)
+
+
+def is_probably_sentinel_rule(file_path: Union[Path, str]) -> bool:
+    """
+    Check whether a YAML file looks like a Sentinel analytics rule.
+
+    A file qualifies when at least two of the top-level keys id, name and
+    kind appear in its first SNIFF_BYTES bytes. Unreadable files qualify, so
+    the loader still gets to report why they cannot be read.
+
+    Args:
+        file_path: Path to the YAML file
+
+    Returns:
+        False if the file is almost certainly not a rule, True otherwise
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(SNIFF_BYTES)
+    except OSError:
+        return True
+
+    keys = set()
+    for match in _RULE_KEY_PATTERN.finditer(head):
+        keys.add(match.group(1))
+        if len(keys) >= 2:
+            return True
+    return False
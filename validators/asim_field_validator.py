@@ -5,11 +5,90 @@ normalized field naming conventions.
 Reference: https://learn.microsoft.com/en-us/azure/sentinel/normalization-common-fields
 """
 
+import functools
+import sys
 from pathlib import Path
 from typing import List, Dict
 
 from .base_validator import BaseValidator
-from config.asim_field_names import VALID_ASIM_FIELD_NAMES, ENTITY_TO_ASIM_PATTERNS
+from config.asim_field_names import VALID_ASIM_FIELD_NAMES, ENTITY_TO_ASIM_PATTERNS, ENTITY_VALID_FIELDS
+
+_NO_FIELDS = frozenset()
+
+# Shared default for missing lists; only ever tested and iterated
+_EMPTY = ()
+
+# Case-folded names for the lenient case-insensitive match
+_CASEFOLDED_ASIM_FIELD_NAMES = frozenset(name.casefold() for name in VALID_ASIM_FIELD_NAMES)
+
+# When every ASIM name is ASCII letters and digits, an ASCII column name with
+# any other character (underscore, space, dot) cannot match even ignoring case
+_ALNUM_ASIM_FIELD_NAMES = all(name.isascii() and name.isalnum() for name in VALID_ASIM_FIELD_NAMES)
+
+_ASIM_DOCS_GUIDANCE = (
+    "Please refer to ASIM documentation for recommended field names: "
+    "https://learn.microsoft.com/en-us/azure/sentinel/normalization-common-fields"
+)
+
+_ASIM_CLOSING = (
+    "Using ASIM-normalized field names improves query consistency and "
+    "cross-source correlation."
+)
+
+
+def _entity_guidance(entity_type: str, pattern_info: dict) -> tuple:
+    """Entity-specific recommendation sentences, built once per entity type"""
+    parts = []
+    
+    examples = pattern_info['examples']
+    if examples:
+        parts.append(
+            f"For '{entity_type}' entities, ASIM recommends field names like: "
+            f"{', '.join(examples[:4])}."
+        )
+    
+    prefixes = pattern_info['prefixes']
+    if prefixes:
+        parts.append(
+            f"Typical prefixes for this entity type: {', '.join(prefixes)}."
+        )
+    
+    return tuple(parts)
+
+
+_ENTITY_GUIDANCE = {
+    entity_type: _entity_guidance(entity_type, pattern_info)
+    for entity_type, pattern_info in ENTITY_TO_ASIM_PATTERNS.items()
+}
+
+
+def _build_warning_message(entity_type, column_name) -> str:
+    """Build the warning text for a non-ASIM column name"""
+    # Unknown entity types get generic guidance
+    guidance = _ENTITY_GUIDANCE.get(entity_type, (_ASIM_DOCS_GUIDANCE,))
+    return " ".join((
+        f"Entity mapping for '{entity_type}' uses columnName '{column_name}' "
+        f"which does not follow ASIM normalized field naming conventions.",
+        *guidance,
+        _ASIM_CLOSING,
+    ))
+
+
+_cached_warning_message = functools.lru_cache(maxsize=1024)(_build_warning_message)
+
+# Per entity type: (lowercased base field, suggested names for it) pairs, so
+# suggestions need no per-call lowercasing or formatting
+_SUGGESTION_TABLE = {
+    entity_type: tuple(
+        (
+            base_field.lower(),
+            tuple(f"{prefix}{base_field}" for prefix in pattern_info['prefixes'])
+            or (base_field,)
+        )
+        for base_field in pattern_info['base_fields']
+    )
+    for entity_type, pattern_info in ENTITY_TO_ASIM_PATTERNS.items()
+}
 
 
 class ASIMFieldValidator(BaseValidator):
@@ -23,7 +102,7 @@ class ASIMFieldValidator(BaseValidator):
         """Validate entity mapping column names follow ASIM conventions"""
         errors = []
         
-        entity_mappings = rule_data.get('entityMappings', [])
+        entity_mappings = rule_data.get('entityMappings', _EMPTY)
         
         if not entity_mappings:
             return errors  # No entity mappings to validate
@@ -51,11 +130,15 @@ class ASIMFieldValidator(BaseValidator):
             # Missing entity type would be caught by entity validator
             return errors
         
-        field_mappings = entity.get('fieldMappings', [])
+        field_mappings = entity.get('fieldMappings', _EMPTY)
         if not field_mappings:
             # Missing field mappings would be caught by entity validator
             return errors
         
+        # The entity's own prefixed names are a subset of the full ASIM list
+        # and cover the common case with a single lookup
+        entity_fields = ENTITY_VALID_FIELDS.get(entity_type, _NO_FIELDS) if isinstance(entity_type, str) else _NO_FIELDS
+        
         # Validate each field mapping
         for field_idx, field_mapping in enumerate(field_mappings):
             if not isinstance(field_mapping, dict):
@@ -68,6 +151,13 @@ class ASIMFieldValidator(BaseValidator):
                 # Missing columnName would be caught by entity validator
                 continue
             
+            if type(column_name) is str:
+                # The ASIM name sets hold interned strings; interning the column
+                # lets repeated names match by identity (str subclasses can't be interned)
+                column_name = sys.intern(column_name)
+                if column_name in entity_fields:
+                    continue
+            
             # Check if column name follows ASIM conventions
             if not self._is_valid_asim_field(column_name):
                 warning = self._create_asim_field_warning(
@@ -94,13 +184,11 @@ class ASIMFieldValidator(BaseValidator):
         if field_name in VALID_ASIM_FIELD_NAMES:
             return True
         
-        # Case-insensitive check (ASIM fields are case-sensitive but we can be lenient)
-        field_name_normalized = field_name
-        for valid_field in VALID_ASIM_FIELD_NAMES:
-            if valid_field.lower() == field_name.lower():
-                return True
+        if _ALNUM_ASIM_FIELD_NAMES and field_name.isascii() and not field_name.isalnum():
+            return False
         
-        return False
+        # Case-insensitive check (ASIM fields are case-sensitive but we can be lenient)
+        return field_name.casefold() in _CASEFOLDED_ASIM_FIELD_NAMES
     
     def _create_asim_field_warning(self, entity_type: str, column_name: str, 
                                    identifier: str, entity_idx: int, field_idx: int) -> Dict:
@@ -117,41 +205,12 @@ class ASIMFieldValidator(BaseValidator):
         Returns:
             Warning dictionary
         """
-        # Build helpful message with entity-specific recommendations
-        message_parts = [
-            f"Entity mapping for '{entity_type}' uses columnName '{column_name}' "
-            f"which does not follow ASIM normalized field naming conventions."
-        ]
-        
-        # Provide entity-specific guidance if available
-        if entity_type in ENTITY_TO_ASIM_PATTERNS:
-            pattern_info = ENTITY_TO_ASIM_PATTERNS[entity_type]
-            examples = pattern_info.get('examples', [])
-            
-            if examples:
-                message_parts.append(
-                    f"For '{entity_type}' entities, ASIM recommends field names like: "
-                    f"{', '.join(examples[:4])}."
-                )
-            
-            prefixes = pattern_info.get('prefixes', [])
-            if prefixes:
-                message_parts.append(
-                    f"Typical prefixes for this entity type: {', '.join(prefixes)}."
-                )
+        # Rules repeat the same entity type and column across files, so the
+        # long message text is memoized for the common all-string case
+        if type(entity_type) is str and type(column_name) is str:
+            message = _cached_warning_message(entity_type, column_name)
         else:
-            # Generic guidance for unknown entity types
-            message_parts.append(
-                "Please refer to ASIM documentation for recommended field names: "
-                "https://learn.microsoft.com/en-us/azure/sentinel/normalization-common-fields"
-            )
-        
-        message_parts.append(
-            "Using ASIM-normalized field names improves query consistency and "
-            "cross-source correlation."
-        )
-        
-        message = " ".join(message_parts)
+            message = _build_warning_message(entity_type, column_name)
         
         return self.create_warning(
             message,
@@ -176,24 +235,17 @@ class ASIMFieldValidator(BaseValidator):
             return suggestions
         
         pattern_info = ENTITY_TO_ASIM_PATTERNS[entity_type]
-        prefixes = pattern_info.get('prefixes', [])
-        base_fields = pattern_info.get('base_fields', [])
         
         # Try to match based on the current field name
         current_lower = current_field.lower()
         
-        # Look for potential base field matches
-        for base_field in base_fields:
-            if base_field.lower() in current_lower or current_lower in base_field.lower():
-                # Add prefixed versions
-                if prefixes:
-                    for prefix in prefixes:
-                        suggestions.append(f"{prefix}{base_field}")
-                else:
-                    suggestions.append(base_field)
+        # Look for potential base field matches, adding their prefixed versions
+        for base_lower, expansions in _SUGGESTION_TABLE[entity_type]:
+            if base_lower in current_lower or current_lower in base_lower:
+                suggestions.extend(expansions)
         
         # If no matches, return examples
         if not suggestions:
-            suggestions = pattern_info.get('examples', [])[:3]
+            suggestions = list(pattern_info['examples'][:3])
         
         return suggestions
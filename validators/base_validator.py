@@ -10,6 +10,8 @@ from typing import List, Dict
 class ValidationError:
     """Represents a validation error or warning"""
     
+    __slots__ = ('severity', 'message', 'field', 'extra')
+    
     def __init__(self, severity: str, message: str, field: str = None, **kwargs):
         self.severity = severity  # 'error' or 'warning'
         self.message = message
@@ -29,7 +31,30 @@ class ValidationError:
 
 
 class BaseValidator(ABC):
-    """Abstract base class for all validators"""
+    """
+    Abstract base class for all validators.
+    
+    Validators hold no per-file state, so one instance is built and reused
+    for every file. Subclasses without instance attributes declare empty
+    __slots__ to keep instances free of a __dict__.
+    """
+    
+    __slots__ = ()
+    
+    # Top-level rule fields this validator cannot do anything without;
+    # the linter skips the validator when any of them is missing
+    requires: frozenset = frozenset()
+    
+    # Whether results depend only on the rule itself and can be cached by
+    # content; validators that look at other files must set this to False
+    cacheable: bool = True
+    
+    # Whether an error from this validator marks the rule as too broken for
+    # expensive validators to be worth running on it
+    stops_pipeline_on_error: bool = False
+    
+    # Whether this validator is skipped once the rule is known to be broken
+    expensive: bool = False
     
     @property
     @abstractmethod
@@ -52,10 +77,23 @@ class BaseValidator(ABC):
         """
         pass
     
+    # Both helpers build the same dictionary as ValidationError.to_dict(),
+    # without creating the intermediate object
+    
     def create_error(self, message: str, field: str = None, **kwargs) -> Dict:
         """Helper to create an error dictionary"""
-        return ValidationError('error', message, field, **kwargs).to_dict()
+        result = {'severity': 'error', 'message': message}
+        if field:
+            result['field'] = field
+        if kwargs:
+            result.update(kwargs)
+        return result
     
     def create_warning(self, message: str, field: str = None, **kwargs) -> Dict:
         """Helper to create a warning dictionary"""
-        return ValidationError('warning', message, field, **kwargs).to_dict()
+        result = {'severity': 'warning', 'message': message}
+        if field:
+            result['field'] = field
+        if kwargs:
+            result.update(kwargs)
+        return result
@@ -3,16 +3,44 @@ Entity Validator
 Validates entity mappings use strong identifiers and reference valid columns.
 """
 
+import sys
 from pathlib import Path
 from typing import List, Dict, Optional
 
 from .base_validator import BaseValidator
-from config.entity_identifiers import ENTITY_STRONG_IDENTIFIERS
+from config.entity_identifiers import ENTITY_STRONG_IDENTIFIERS, ENTITY_STRONG_IDENTIFIERS_ORDER
+
+
+def _by_lower(names) -> Dict[str, str]:
+    """Map each lowercased name to its proper casing, first match winning"""
+    table = {}
+    for name in names:
+        table.setdefault(name.lower(), name)
+    return table
+
+
+# Case-insensitive lookups, so miscased names are corrected without a scan
+_ENTITY_BY_LOWER = _by_lower(ENTITY_STRONG_IDENTIFIERS)
+_IDENTIFIERS_BY_LOWER = {
+    entity_type: _by_lower(identifiers)
+    for entity_type, identifiers in ENTITY_STRONG_IDENTIFIERS_ORDER.items()
+}
+
+# Option lists quoted in error messages
+_VALID_ENTITY_TYPES = ', '.join(sorted(ENTITY_STRONG_IDENTIFIERS))
+_VALID_IDENTIFIERS = {
+    entity_type: ', '.join(identifiers)
+    for entity_type, identifiers in ENTITY_STRONG_IDENTIFIERS_ORDER.items()
+}
 
 
 class EntityValidator(BaseValidator):
     """Validates entity mappings"""
     
+    __slots__ = ()
+    
+    requires = frozenset({'entityMappings'})
+    
     @property
     def validator_name(self) -> str:
         return "Entity Validator"
@@ -43,11 +71,14 @@ class EntityValidator(BaseValidator):
     def _validate_entity(self, entity: dict, index: int) -> List[Dict]:
         """Validate a single entity mapping"""
         errors = []
+        append = errors.append
+        create_error = self.create_error
+        prefix = f'entityMappings[{index}]'
         
         if not isinstance(entity, dict):
-            errors.append(self.create_error(
+            append(create_error(
                 f"Entity mapping at index {index} must be a dictionary",
-                field=f'entityMappings[{index}]'
+                field=prefix
             ))
             return errors
         
@@ -59,37 +90,47 @@ class EntityValidator(BaseValidator):
                 if 'entity' in key.lower() or 'type' in key.lower()
             ]
             if similar_fields:
-                errors.append(self.create_error(
+                append(create_error(
                     f"Found similar field '{similar_fields[0]}' - did you mean 'entityType'?",
-                    field=f'entityMappings[{index}].{similar_fields[0]}'
+                    field=f'{prefix}.{similar_fields[0]}'
                 ))
                 return errors
         
         # Check required fields
         entity_type = entity.get('entityType')
         if not entity_type:
-            errors.append(self.create_error(
+            append(create_error(
                 f"Entity mapping at index {index} missing 'entityType'",
-                field=f'entityMappings[{index}].entityType'
+                field=f'{prefix}.entityType'
             ))
             return errors
         
+        # The configured names are interned literals; interning the parsed
+        # name lets each table lookup below match on identity
+        if type(entity_type) is str:
+            entity_type = sys.intern(entity_type)
+        
         field_mappings = entity.get('fieldMappings', [])
         if not field_mappings:
-            errors.append(self.create_error(
+            append(create_error(
                 f"Entity '{entity_type}' has no fieldMappings",
-                field=f'entityMappings[{index}].fieldMappings'
+                field=f'{prefix}.fieldMappings'
             ))
             return errors
         
         # Validate field mappings count (1-3 identifiers per entity)
         if len(field_mappings) > 3:
-            errors.append(self.create_error(
+            append(create_error(
             f"Entity '{entity_type}' has {len(field_mappings)} fieldMappings but maximum allowed is 3",
-            field=f'entityMappings[{index}].fieldMappings'
+            field=f'{prefix}.fieldMappings'
             ))
 
         
+        # Whether entityType is a known type; checked once, at the first
+        # complete field mapping, so a bad type is reported only once
+        known_type = None
+        strong_identifiers = None
+        
         # Validate field mappings
         for field_idx, field_mapping in enumerate(field_mappings):
             if not isinstance(field_mapping, dict):
@@ -99,36 +140,44 @@ class EntityValidator(BaseValidator):
             column_name = field_mapping.get('columnName')
             
             if not identifier:
-                errors.append(self.create_error(
+                append(create_error(
                     f"Field mapping for entity '{entity_type}' missing 'identifier'",
-                    field=f'entityMappings[{index}].fieldMappings[{field_idx}].identifier'
+                    field=f'{prefix}.fieldMappings[{field_idx}].identifier'
                 ))
                 continue
             
             if not column_name:
-                errors.append(self.create_error(
+                append(create_error(
                     f"Field mapping for entity '{entity_type}' missing 'columnName'",
-                    field=f'entityMappings[{index}].fieldMappings[{field_idx}].columnName'
+                    field=f'{prefix}.fieldMappings[{field_idx}].columnName'
                 ))
                 continue
             
+            if known_type is None:
+                type_error = self._validate_entity_type(entity_type, index)
+                known_type = type_error is None
+                if type_error:
+                    append(type_error)
+                else:
+                    strong_identifiers = ENTITY_STRONG_IDENTIFIERS[entity_type]
+            if not known_type:
+                continue
+            
+            # Correctly cased strong identifiers are the common case
+            if isinstance(identifier, str) and identifier in strong_identifiers:
+                continue
+            
             # Validate strong identifier
             identifier_error = self._validate_strong_identifier(
                 entity_type, identifier, index, field_idx
             )
             if identifier_error:
-                errors.append(identifier_error)
+                append(identifier_error)
         
         return errors
     
-    def _validate_strong_identifier(self, entity_type: str, identifier: str, 
-                                entity_idx: int, field_idx: int) -> Dict:
-        """
-        Validate that the identifier is a strong identifier for the entity type.
-
-        Reference: https://learn.microsoft.com/en-us/azure/sentinel/entities-reference
-        """
-        # Ensure entity_type is valid (exact case)
+    def _validate_entity_type(self, entity_type: str, entity_idx: int) -> Optional[Dict]:
+        """Validate that the entity type is known, with its exact casing"""
         if entity_type not in ENTITY_STRONG_IDENTIFIERS:
             # If the entity exists with different casing, report casing error
             correct_case = self._find_correct_entity_case(entity_type)
@@ -139,15 +188,21 @@ class EntityValidator(BaseValidator):
                 )
 
             # Unknown entity type
-            valid_types = ', '.join(sorted(ENTITY_STRONG_IDENTIFIERS.keys()))
             return self.create_error(
-                f"Unknown entity type '{entity_type}'. Valid entity types are: {valid_types}",
+                f"Unknown entity type '{entity_type}'. Valid entity types are: {_VALID_ENTITY_TYPES}",
                 field=f'entityMappings[{entity_idx}].entityType'
             )
 
-        # Ensure identifier is one of the strong identifiers for this entity
-        strong_identifiers = ENTITY_STRONG_IDENTIFIERS[entity_type]
+        return None
+    
+    def _validate_strong_identifier(self, entity_type: str, identifier: str, 
+                                entity_idx: int, field_idx: int) -> Dict:
+        """
+        Validate that the identifier is a strong identifier for the entity type.
+        The entity type must already have passed _validate_entity_type.
 
+        Reference: https://learn.microsoft.com/en-us/azure/sentinel/entities-reference
+        """
         # Defensive checks
         if not isinstance(identifier, str) or not identifier:
             return self.create_error(
@@ -155,19 +210,15 @@ class EntityValidator(BaseValidator):
                 field=f'entityMappings[{entity_idx}].fieldMappings[{field_idx}].identifier'
             )
 
-        # Find case-insensitive match
-        correct_identifier = None
-        for valid_id in strong_identifiers:
-            if valid_id.lower() == identifier.lower():
-                correct_identifier = valid_id
-                break
+        # Ensure identifier is one of the strong identifiers for this entity,
+        # matching case-insensitively
+        correct_identifier = _IDENTIFIERS_BY_LOWER[entity_type].get(identifier.lower())
 
         if correct_identifier is None:
             # Identifier not in list -> ERROR (per request)
-            valid_ids = ', '.join(strong_identifiers)
             return self.create_error(
                 f"Invalid identifier '{identifier}' for entity type '{entity_type}'. "
-                f"Valid identifiers: {valid_ids}",
+                f"Valid identifiers: {_VALID_IDENTIFIERS[entity_type]}",
                 field=f'entityMappings[{entity_idx}].fieldMappings[{field_idx}].identifier'
             )
 
@@ -183,21 +234,6 @@ class EntityValidator(BaseValidator):
     def _find_correct_entity_case(self, entity_type: str) -> Optional[str]:
         """
         Find the correct casing for an entity type if it exists.
-        Returns the correctly-cased entity type (from ENTITY_STRONG_IDENTIFIERS) or None.
-        """
-        if not entity_type or not isinstance(entity_type, str):
-            return None
-
-        entity_lower = entity_type.lower()
-        for valid_entity in ENTITY_STRONG_IDENTIFIERS.keys():
-            if valid_entity.lower() == entity_lower:
-                return valid_entity
-
-        return None
-    
-    def _find_correct_entity_case(self, entity_type: str) -> str:
-        """
-        Find the correct casing for an entity type if it exists.
         
         Args:
             entity_type: Entity type with potentially incorrect casing
@@ -207,11 +243,5 @@ class EntityValidator(BaseValidator):
         """
         if not entity_type:
             return None
-            
-        entity_lower = entity_type.lower()
         
-        for valid_entity in ENTITY_STRONG_IDENTIFIERS:
-            if valid_entity.lower() == entity_lower:
-                return valid_entity
-        
-        return None
+        return _ENTITY_BY_LOWER.get(entity_type.lower())
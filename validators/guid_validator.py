@@ -3,23 +3,45 @@ GUID Validator
 Validates that the 'id' field contains a valid GUID and is unique across files.
 """
 
+import os
+import re
+import threading
 import uuid
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .base_validator import BaseValidator
-from utils.yaml_loader import load_yaml_file
+from utils.yaml_loader import load_yaml_bytes, read_file_bytes, YAMLLoadError
+
+# The canonical hyphenated form used by Sentinel rules
+_CANONICAL_GUID_PATTERN = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+)
 
 
 class GuidValidator(BaseValidator):
     """Validates GUID format and uniqueness"""
     
+    __slots__ = ()
+    
+    # Uniqueness depends on every other file in the run
+    cacheable = False
+    stops_pipeline_on_error = True
+    
     @property
     def validator_name(self) -> str:
         return "GUID Validator"
     
     def validate(self, rule_data: dict, file_path: Path, all_files: List[Path] = None) -> List[Dict]:
-        """Validate GUID format and uniqueness"""
+        """
+        Validate GUID format and uniqueness
+        
+        The other files' GUIDs are indexed once per file list. Passing the
+        same tuple for every file makes the index check O(1); a list is
+        compared entry by entry on each call. Files listed as duplicates are
+        re-read if they changed on disk, but a file edited to gain this GUID
+        between calls is not seen until all_files lists different files.
+        """
         errors = []
         
         # Check if 'id' field exists
@@ -58,6 +80,10 @@ class GuidValidator(BaseValidator):
         if not isinstance(value, str):
             return False
         
+        if _CANONICAL_GUID_PATTERN.fullmatch(value):
+            return True
+        
+        # Other spellings uuid accepts (braces, urn:uuid:, no hyphens) stay valid
         try:
             uuid.UUID(value)
             return True
@@ -68,42 +94,191 @@ class GuidValidator(BaseValidator):
         """Find other files with the same GUID (robust comparison)."""
         duplicates = []
 
-        try:
-            current_file_resolved = Path(current_file).resolve()
-        except Exception:
-            current_file_resolved = None
-
         # Normalize the GUID to a comparable string
         guid_norm = str(guid).strip().lower()
 
-        for file_entry in all_files:
-            try:
-                other_path = Path(file_entry)
-            except Exception:
-                # skip invalid path entries
+        # Resolved lazily: a unique GUID only ever matches the current file
+        # itself, which plain path equality already recognizes
+        current_file_resolved = _UNRESOLVED
+
+        index, signatures = _guid_index(all_files)
+        for other_path in index.get(guid_norm, ()):
+            if other_path == current_file:
                 continue
 
+            if current_file_resolved is _UNRESOLVED:
+                try:
+                    current_file_resolved = Path(current_file).resolve()
+                except (TypeError, OSError, RuntimeError):
+                    current_file_resolved = None
+
             # Skip the current file (compare resolved paths when possible)
             try:
                 if current_file_resolved and other_path.resolve() == current_file_resolved:
                     continue
-            except Exception:
+            except (OSError, RuntimeError):
                 # if resolve fails, fall back to string comparison
                 if str(other_path) == str(current_file):
                     continue
 
-            try:
-                other_rule = load_yaml_file(other_path)
-            except Exception:
-                # Skip files that can't be loaded
+            # Only matches are re-checked: a file edited since the index was built
+            # is read again, so a GUID it no longer holds is not reported
+            if _stat_signature(other_path) != signatures[other_path] and _file_guid(other_path) != guid_norm:
                 continue
 
-            other_guid = other_rule.get('id')
+            duplicates.append(other_path)
+
+        return duplicates
+
+
+# Marks a path that has not been resolved yet
+_UNRESOLVED = object()
+
+# Index of the most recent file list: (the files as a tuple, {normalized GUID: [paths]},
+# {indexed path: stat signature when it was read}). Every file in a run is
+# checked against the same list, so it is loaded once per run instead of once
+# per validated file.
+_GUID_INDEX = ((), {}, {})
+_GUID_INDEX_LOCK = threading.Lock()
+
+
+def build_guid_index(all_files: Sequence[Path]) -> tuple:
+    """
+    Build the GUID index for all_files ahead of validation and return it.
+    
+    Pass the same tuple of files to every validate call: a tuple cannot be
+    edited in place, so its identity alone tells the index is current. The
+    returned index can be handed to worker processes with install_guid_index.
+    """
+    _guid_index(all_files)
+    return _GUID_INDEX
+
+
+def install_guid_index(guid_index: tuple):
+    """Use an index returned by build_guid_index, e.g. in a worker process"""
+    global _GUID_INDEX
+    _GUID_INDEX = guid_index
+
+
+def _guid_index(all_files: Sequence[Path]) -> Tuple[Dict[str, List[Path]], Dict[Path, Optional[Tuple[int, int]]]]:
+    """Return the GUID index for all_files and the signatures of its paths, building it on first use"""
+    global _GUID_INDEX
+    
+    snapshot, index, signatures = _GUID_INDEX
+    if snapshot is all_files:
+        return index, signatures
+    
+    # Lists can change in place, so they are compared against a copy; the
+    # entries are the same objects, but this is still one comparison per file
+    files = all_files if type(all_files) is tuple else tuple(all_files)
+    if snapshot == files:
+        return index, signatures
+    
+    with _GUID_INDEX_LOCK:
+        snapshot, index, signatures = _GUID_INDEX
+        if snapshot is files or snapshot == files:
+            return index, signatures
+        
+        paths = []
+        for file_entry in files:
+            try:
+                paths.append(Path(file_entry))
+            except TypeError:
+                # skip invalid path entries
+                continue
+        
+        # Taken before reading, so an edit made while the index is built still
+        # shows up as a changed signature
+        path_signatures = list(map(_stat_signature, paths))
+        
+        index = {}
+        signatures = {}
+        for other_path, other_signature, other_guid in zip(paths, path_signatures, _map_file_guids(paths)):
             if other_guid is None:
                 continue
 
-            # Normalize and compare
-            if str(other_guid).strip().lower() == guid_norm:
-                duplicates.append(other_path)
+            index.setdefault(other_guid, []).append(other_path)
+            signatures[other_path] = other_signature
+        
+        _GUID_INDEX = (files, index, signatures)
+        return index, signatures
 
-        return duplicates
+
+def _stat_signature(file_path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it cannot be stat'ed"""
+    try:
+        stat_result = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+# A single unindented id key holding a canonical GUID, optionally quoted and
+# followed by a comment. Anything fancier is left to the YAML parser.
+_ID_KEY_PATTERN = re.compile(rb'^(?:\xef\xbb\xbf)?["\']?id["\']?[ \t]*:', re.MULTILINE)
+_ID_LINE_PATTERN = re.compile(
+    rb'^(?:\xef\xbb\xbf)?id[ \t]*:[ \t]*(["\']?)'
+    rb'([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})'
+    rb'\1(?:[ \t]+#[^\n]*)?[ \t]*\r?$',
+    re.MULTILINE
+)
+# Indented lines after the id could continue a plain scalar
+_CONTINUATION_PATTERN = re.compile(rb'(?:[ \t]*\r?\n)*[ \t]')
+# Several documents, or directives, change how the file loads
+_DOCUMENT_MARKER_PATTERN = re.compile(rb'^(?:---|\.\.\.|%)', re.MULTILINE)
+
+# Below this many files a thread pool costs more than it overlaps
+_PARALLEL_INDEX_MIN_FILES = 64
+
+
+def _map_file_guids(paths: List[Path]) -> Iterable[Optional[str]]:
+    """Return the GUID of each path in order, reading larger sets on a thread pool"""
+    if len(paths) < _PARALLEL_INDEX_MIN_FILES:
+        return map(_file_guid, paths)
+    
+    # Reading is I/O bound, so threads overlap it even on a single core
+    from concurrent.futures import ThreadPoolExecutor
+    
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_file_guid, paths))
+
+
+def _file_guid(file_path: Path) -> Optional[str]:
+    """Return the normalized id of a rule file, or None if it has none or cannot be loaded"""
+    try:
+        content = read_file_bytes(file_path)
+    except OSError:
+        # Missing and unreadable files are skipped, as load_yaml_file would fail on them
+        return None
+    
+    guid = _sniff_guid(content)
+    if guid is not None:
+        return guid
+    
+    try:
+        other_rule = load_yaml_bytes(content, file_path)
+    except YAMLLoadError:
+        # Skip files that can't be loaded
+        return None
+    
+    other_guid = other_rule.get('id')
+    if other_guid is None:
+        return None
+    return str(other_guid).strip().lower()
+
+
+def _sniff_guid(content: bytes) -> Optional[str]:
+    """Read an unambiguous GUID id line without parsing the YAML, or return None"""
+    if _DOCUMENT_MARKER_PATTERN.search(content):
+        return None
+    
+    keys = _ID_KEY_PATTERN.findall(content)
+    if len(keys) != 1:
+        return None
+    
+    match = _ID_LINE_PATTERN.search(content)
+    if match is None or _CONTINUATION_PATTERN.match(content, match.end() + 1):
+        return None
+    
+    return match.group(2).decode('ascii').lower()
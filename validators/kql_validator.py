@@ -4,16 +4,52 @@ Validates KQL queries using Microsoft Kusto.Language library via Python.NET.
 """
 
 import platform
+import re
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 
 from .base_validator import BaseValidator
 
+# Linux and macOS run .NET on CoreCLR, which must be selected before clr is imported
+_PLATFORM_SYSTEM = platform.system()
+_USES_CORECLR = _PLATFORM_SYSTEM in ("Linux", "Darwin")
+
+# Set once the runtime is selected, so a retried DLL load does not select it again
+_runtime_configured = False
+
+# Semantic diagnostics worth reporting; the 'type' check ignores case
+_SEMANTIC_MESSAGE_PATTERN = re.compile(r'does not exist|does not refer|(?i:type)')
+
+# Kusto.Language reports severities as strings, which Python.NET hands
+# over as str; the common ones map straight to the names used here
+_SEVERITY_NAMES = {'Error': 'error', 'Warning': 'warning'}
+
+
+def _severity_of(diag) -> str:
+    """Return a diagnostic's severity, lowercased"""
+    severity = diag.Severity
+    return _SEVERITY_NAMES.get(severity) or str(severity).lower()
+
 
 class KQLValidator(BaseValidator):
-    """Validates KQL queries using Microsoft Kusto.Language"""
+    """
+    Validates KQL queries using Microsoft Kusto.Language.
+    
+    One instance may validate rules on several threads at once, which is
+    how SentinelLinter.validate_directory runs KQL validation. Parsing
+    happens in .NET, so those threads overlap. This relies on the instance
+    not changing after construction: global_state is an immutable Kusto
+    GlobalState and must not be replaced while validation is running.
+    """
+    
+    __slots__ = ('schema_config', 'global_state')
+    
+    requires = frozenset({'query'})
+    expensive = True
     
     _dll_loaded = False
+    _load_lock = threading.Lock()
     _KustoCode = None
     _GlobalState = None
     _DatabaseSymbol = None
@@ -53,6 +89,13 @@ class KQLValidator(BaseValidator):
         if KQLValidator._dll_loaded:
             return  # Already loaded
         
+        # Validators built on several threads at once must load the assembly only once
+        with KQLValidator._load_lock:
+            if not KQLValidator._dll_loaded:
+                self._load_kusto_dll_locked()
+    
+    def _load_kusto_dll_locked(self):
+        """Load the DLL; the caller holds _load_lock"""
         try:
             # Configure runtime for platform BEFORE importing clr
             # This must happen first on macOS/Linux
@@ -108,18 +151,29 @@ class KQLValidator(BaseValidator):
                 KQLValidator._TableSymbol = TableSymbol
                 KQLValidator._dll_loaded = True
                 return
-            except Exception as import_err:
-                # Fallback: probe assembly types and import using discovered namespace
+            except ImportError as import_err:
+                # Fallback: probe assembly types and import using discovered namespace.
+                # Only public types are importable, so skip reflecting over the rest.
                 try:
-                    available = [t.FullName for t in assembly.GetTypes()]
+                    available = [t.FullName for t in assembly.GetExportedTypes() if t.FullName]
                 except Exception:
                     available = []
                 
+                # First full name for each simple type name, for direct lookup
+                by_simple_name = {}
+                for full_name in available:
+                    namespace, _, simple_name = full_name.rpartition('.')
+                    if namespace:
+                        by_simple_name.setdefault(simple_name, full_name)
+                
                 def _import_type_by_shortname(shortname: str):
-                    matches = [t for t in available if t.endswith(f".{shortname}")]
-                    if not matches:
+                    if '.' in shortname:
+                        matches = [t for t in available if t.endswith(f".{shortname}")]
+                        full_name = matches[0] if matches else None
+                    else:
+                        full_name = by_simple_name.get(shortname)
+                    if not full_name:
                         return None
-                    full_name = matches[0]
                     parts = full_name.split('.')
                     ns = '.'.join(parts[:-1])
                     type_name = parts[-1]
@@ -175,15 +229,18 @@ class KQLValidator(BaseValidator):
   
     def _configure_runtime(self):
         """Configure Python.NET runtime based on platform"""
-        if platform.system() in ["Linux", "Darwin"]:
+        global _runtime_configured
+        
+        if _USES_CORECLR and not _runtime_configured:
             # Use CoreCLR on Linux/Mac (must be done before importing clr)
             try:
                 from pythonnet import load
                 load("coreclr")
+                _runtime_configured = True
             except Exception as e:
                 # Re-raise with more helpful message
                 raise RuntimeError(
-                    f"Failed to configure .NET runtime for {platform.system()}. "
+                    f"Failed to configure .NET runtime for {_PLATFORM_SYSTEM}. "
                     f"Ensure .NET runtime is installed: brew install --cask dotnet (macOS) "
                     f"or visit https://dotnet.microsoft.com/download. Error: {e}"
                 )
@@ -249,8 +306,18 @@ class KQLValidator(BaseValidator):
             ))
             return errors
         
+        # Parse once; syntax checks and output column extraction share the result
+        try:
+            code = self._KustoCode.Parse(query)
+        except Exception as e:
+            errors.append(self.create_error(
+                f"Failed to parse KQL query: {str(e)}",
+                field='query'
+            ))
+            return errors
+        
         # Perform syntax validation
-        syntax_errors = self._validate_syntax(query)
+        syntax_errors = self._validate_syntax(query, code)
         errors.extend(syntax_errors)
         
         # If syntax is valid and we have schema, do semantic validation
@@ -260,37 +327,35 @@ class KQLValidator(BaseValidator):
         
         # Validate entity columns exist in query output
         if not syntax_errors:
-            entity_errors = self._validate_entity_columns(query, rule_data)
+            entity_errors = self._validate_entity_columns(code, rule_data)
             errors.extend(entity_errors)
         
         return errors
     
-    def _validate_syntax(self, query: str) -> List[Dict]:
-        """Validate KQL syntax"""
+    def _validate_syntax(self, query: str, code) -> List[Dict]:
+        """Validate KQL syntax from the parsed query"""
         errors = []
         
         try:
-            # Parse the query
-            code = self._KustoCode.Parse(query)
-            
             # Get diagnostics
             diagnostics = code.GetDiagnostics()
             
             for diag in diagnostics:
-                severity = str(diag.Severity).lower()
-                message = str(diag.Message)
-                start = diag.Start
-                length = diag.Length
-                
-                # Extract problematic code snippet
-                query_excerpt = self._get_query_excerpt(query, start, length)
+                severity = _severity_of(diag)
                 
                 if severity == 'error':
+                    message = str(diag.Message)
+                    start = diag.Start
+                    
+                    # Extract problematic code snippet
+                    query_excerpt = self._get_query_excerpt(query, start, diag.Length)
+                    
                     errors.append(self.create_error(
                         f"KQL syntax error: {message}. Issue at position {start}: '{query_excerpt}'",
                         field='query'
                     ))
                 elif severity == 'warning':
+                    message = str(diag.Message)
                     errors.append(self.create_warning(
                         f"KQL syntax warning: {message}",
                         field='query'
@@ -316,11 +381,13 @@ class KQLValidator(BaseValidator):
             diagnostics = code.GetDiagnostics()
             
             for diag in diagnostics:
-                severity = str(diag.Severity).lower()
+                severity = _severity_of(diag)
+                if severity != 'error' and severity != 'warning':
+                    continue
                 message = str(diag.Message)
                 
                 # Only report semantic errors (skip syntax errors already reported)
-                if 'does not exist' in message or 'does not refer' in message or 'type' in message.lower():
+                if _SEMANTIC_MESSAGE_PATTERN.search(message):
                     if severity == 'error':
                         errors.append(self.create_error(
                             f"KQL semantic error: {message}",
@@ -341,8 +408,8 @@ class KQLValidator(BaseValidator):
         
         return errors
     
-    def _validate_entity_columns(self, query: str, rule_data: dict) -> List[Dict]:
-        """Validate that entity mapping columns exist in query output"""
+    def _validate_entity_columns(self, code, rule_data: dict) -> List[Dict]:
+        """Validate that entity mapping columns exist in the parsed query's output"""
         errors = []
         
         entity_mappings = rule_data.get('entityMappings', [])
@@ -351,12 +418,16 @@ class KQLValidator(BaseValidator):
         
         try:
             # Extract output columns from query
-            output_columns = self._extract_output_columns(query)
+            output_columns = self._extract_output_columns(code)
             
             if not output_columns:
                 # Could not extract columns, skip validation
                 return errors
             
+            # Listed in every missing-column error; built on the first one
+            available = None
+            columns_by_casefold = None
+            
             # Check each entity mapping
             for idx, entity in enumerate(entity_mappings):
                 entity_type = entity.get('entityType')
@@ -366,10 +437,23 @@ class KQLValidator(BaseValidator):
                     column_name = field_mapping.get('columnName')
                     
                     if column_name and column_name not in output_columns:
-                        available = ', '.join(sorted(output_columns))
+                        if available is None:
+                            sorted_columns = sorted(output_columns)
+                            available = ', '.join(sorted_columns)
+                            columns_by_casefold = {}
+                            for column in sorted_columns:
+                                columns_by_casefold.setdefault(column.casefold(), column)
+                        
+                        # Column names are case-sensitive, so point out a miscased one
+                        hint = ''
+                        if isinstance(column_name, str):
+                            match = columns_by_casefold.get(column_name.casefold())
+                            if match:
+                                hint = f" Did you mean '{match}'? Column names are case-sensitive."
+                        
                         errors.append(self.create_error(
                             f"Entity mapping for '{entity_type}' references column '{column_name}' "
-                            f"which is not present in query output. Available columns: {available}",
+                            f"which is not present in query output.{hint} Available columns: {available}",
                             field=f'entityMappings[{idx}].fieldMappings[{field_idx}].columnName'
                         ))
         
@@ -382,23 +466,20 @@ class KQLValidator(BaseValidator):
         
         return errors
     
-    def _extract_output_columns(self, query: str) -> set:
-        """Extract final output columns from KQL query"""
+    def _extract_output_columns(self, code) -> set:
+        """Extract final output columns from the parsed query"""
         columns = set()
         
         try:
-            # Parse the query
-            code = self._KustoCode.Parse(query)
+            # Get the result type (columns in the output); attribute access on
+            # .NET objects is slow, so read each attribute once rather than
+            # probing with hasattr first
+            result_type = code.ResultType
             
-            # Get the result type (columns in the output)
-            if hasattr(code, 'ResultType') and code.ResultType:
-                result_type = code.ResultType
-                
-                # Extract column names
-                if hasattr(result_type, 'Columns'):
-                    for column in result_type.Columns:
-                        if hasattr(column, 'Name'):
-                            columns.add(str(column.Name))
+            # Extract column names; scalar results have no Columns
+            if result_type:
+                for column in result_type.Columns:
+                    columns.add(str(column.Name))
         
         except Exception:
             # If extraction fails, return empty set
@@ -2,6 +2,9 @@
 Sentinel Constraints Validator
 Validates Microsoft Sentinel Analytics Rule field constraints and requirements.
 Reference: https://learn.microsoft.com/en-us/azure/sentinel/sentinel-analytic-rules-creation
+
+Rule data comes from the YAML loader, which only builds plain dicts and lists,
+so container checks here compare type(x) exactly instead of using isinstance.
 """
 
 import re
@@ -10,21 +13,66 @@ from typing import List, Dict
 
 from .base_validator import BaseValidator
 
+# T1000-T1999, optionally followed by . and a 1-3 digit sub-technique other than 0
+_TECHNIQUE_PATTERN = re.compile(r'^T1\d{3}(?:\.(?!0+$)\d{1,3})?$')
+
+# Semantic versioning: major.minor.patch
+_VERSION_PATTERN = re.compile(r'^\d+\.\d+\.\d+$')
+
+# Alert format parameters ({{columnName}}), with optional whitespace inside the braces
+_ALERT_PARAMETER_PATTERN = re.compile(r'\{\{\s*\w+\s*\}\}')
+
+# Alert format parameters with leading or trailing whitespace inside the braces
+_SPACED_ALERT_PARAMETER_PATTERN = re.compile(r'\{\{(?:\s+\w+\s*|\w+\s+)\}\}')
+
+# customDetails keys: a letter followed by letters and digits
+_CUSTOM_DETAILS_KEY_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9]*$')
+
+# Default for optional sections, so a missing section can be told apart from
+# an explicit null without allocating an empty dict per rule
+_MISSING = object()
+
+# Duration unit -> (multiplier, divisor) converting a value to hours.
+# Minutes divide rather than multiply by 1/60, which would round differently.
+# Units are case-insensitive, so both cases are listed
+_DURATION_UNIT_SCALES = {
+    'h': (1, 1), 'd': (24, 1), 'm': (1, 60),
+    'H': (1, 1), 'D': (24, 1), 'M': (1, 60),
+}
+
 
 class SentinelConstraintsValidator(BaseValidator):
-    """Validates Sentinel-specific field constraints and requirements"""
+    """
+    Validates Sentinel-specific field constraints and requirements.
+    
+    Everything the checks precompute (patterns, value sets, display strings)
+    lives at module or class level, so instances carry no state and are
+    cheap to share between threads or hand to worker processes.
+    """
+    
+    __slots__ = ()
+    
+    # The VALID_* sets are for membership tests; the ordered tuples
+    # behind them keep the listing in error messages stable, and the
+    # *_DISPLAY strings are that listing joined once for error messages
     
     # Valid values for kind field
-    VALID_KINDS = ["Scheduled", "NRT"]
+    _VALID_KINDS_ORDERED = ("Scheduled", "NRT")
+    VALID_KINDS = frozenset(_VALID_KINDS_ORDERED)
+    _VALID_KINDS_DISPLAY = "', '".join(_VALID_KINDS_ORDERED)
     
     # Valid values for severity field
-    VALID_SEVERITIES = ["Informational", "Low", "Medium", "High"]
+    _VALID_SEVERITIES_ORDERED = ("Informational", "Low", "Medium", "High")
+    VALID_SEVERITIES = frozenset(_VALID_SEVERITIES_ORDERED)
+    _VALID_SEVERITIES_DISPLAY = "', '".join(_VALID_SEVERITIES_ORDERED)
     
     # Valid values for triggerOperator field
-    VALID_TRIGGER_OPERATORS = ["GreaterThan", "LessThan", "Equal", "gt", "lt", "eq"]
+    _VALID_TRIGGER_OPERATORS_ORDERED = ("GreaterThan", "LessThan", "Equal", "gt", "lt", "eq")
+    VALID_TRIGGER_OPERATORS = frozenset(_VALID_TRIGGER_OPERATORS_ORDERED)
+    _VALID_TRIGGER_OPERATORS_DISPLAY = "', '".join(_VALID_TRIGGER_OPERATORS_ORDERED)
     
     # Valid MITRE ATT&CK v13 tactics (no spaces)
-    VALID_TACTICS = [
+    _VALID_TACTICS_ORDERED = (
         "Reconnaissance",
         "ResourceDevelopment",
         "InitialAccess",
@@ -39,10 +87,14 @@ class SentinelConstraintsValidator(BaseValidator):
         "CommandAndControl",
         "Exfiltration",
         "Impact"
-    ]
+    )
+    VALID_TACTICS = frozenset(_VALID_TACTICS_ORDERED)
+    _VALID_TACTICS_DISPLAY = ", ".join(_VALID_TACTICS_ORDERED)
     
     # Valid values for eventGroupingSettings.aggregationKind
-    VALID_AGGREGATION_KINDS = ["SingleAlert", "AlertPerResult"]
+    _VALID_AGGREGATION_KINDS_ORDERED = ("SingleAlert", "AlertPerResult")
+    VALID_AGGREGATION_KINDS = frozenset(_VALID_AGGREGATION_KINDS_ORDERED)
+    _VALID_AGGREGATION_KINDS_DISPLAY = "', '".join(_VALID_AGGREGATION_KINDS_ORDERED)
     
     # Constraint limits
     MAX_NAME_LENGTH = 50
@@ -64,132 +116,127 @@ class SentinelConstraintsValidator(BaseValidator):
     
     def validate(self, rule_data: dict, file_path: Path, all_files: List[Path] = None) -> List[Dict]:
         """Validate Sentinel-specific constraints"""
+        # The checks below append to this one list, in this order
         errors = []
         
+        # Each check receives only the field it validates; customDetails
+        # feeds two checks, so it is read once for both
+        custom_details = rule_data.get('customDetails')
+        
         # Validate kind field
-        errors.extend(self._validate_kind(rule_data))
+        self._validate_kind(rule_data.get('kind'), errors)
         
         # Validate severity field
-        errors.extend(self._validate_severity(rule_data))
+        self._validate_severity(rule_data.get('severity'), errors)
         
         # Validate triggerOperator field
-        errors.extend(self._validate_trigger_operator(rule_data))
+        self._validate_trigger_operator(rule_data.get('triggerOperator'), errors)
         
         # Validate triggerThreshold field
-        errors.extend(self._validate_trigger_threshold(rule_data))
+        self._validate_trigger_threshold(rule_data.get('triggerThreshold'), errors)
         
         # Validate tactics field
-        errors.extend(self._validate_tactics(rule_data))
+        self._validate_tactics(rule_data.get('tactics'), errors)
         
         # Validate relevantTechniques field
-        errors.extend(self._validate_relevant_techniques(rule_data))
+        self._validate_relevant_techniques(rule_data.get('relevantTechniques'), errors)
         
         # Validate name field constraints
-        errors.extend(self._validate_name_constraints(rule_data))
+        self._validate_name_constraints(rule_data.get('name'), errors)
         
         # Validate description field constraints
-        errors.extend(self._validate_description_constraints(rule_data))
+        self._validate_description_constraints(rule_data.get('description'), errors)
         
         # Validate query field constraints
-        errors.extend(self._validate_query_constraints(rule_data))
+        self._validate_query_constraints(rule_data.get('query'), errors)
         
         # Validate version field format
-        errors.extend(self._validate_version(rule_data))
+        self._validate_version(rule_data.get('version'), errors)
         
         # Validate eventGroupingSettings
-        errors.extend(self._validate_event_grouping(rule_data))
+        self._validate_event_grouping(rule_data.get('eventGroupingSettings'), errors)
         
         # Validate entity mappings limits
-        errors.extend(self._validate_entity_mappings_limits(rule_data))
+        self._validate_entity_mappings_limits(rule_data.get('entityMappings'), errors)
         
         # Validate customDetails limits
-        errors.extend(self._validate_custom_details(rule_data))
+        self._validate_custom_details(custom_details, errors)
         
         # Validate alertDetailsOverride constraints
-        errors.extend(self._validate_alert_details_override(rule_data))
+        self._validate_alert_details_override(rule_data.get('alertDetailsOverride'), errors)
         
         # Validate Grouping Errors
-        errors.extend(self._validate_grouping_configuration(rule_data))
+        self._validate_grouping_configuration(rule_data.get('incidentConfiguration', _MISSING), errors)
         
         # Validate customDetails keys (must start with letter, alphanumeric only)
-        errors.extend(self._validate_custom_details_keys(rule_data))
+        self._validate_custom_details_keys(custom_details, errors)
         
         return errors
     
-    def _validate_kind(self, rule_data: dict) -> List[Dict]:
+    def _validate_kind(self, kind: str, errors: List[Dict]) -> None:
         """Validate kind field"""
-        errors = []
+        # Valid values need no further checks; the empty check below strips,
+        # and only runs for values that are going to be reported anyway
+        if isinstance(kind, str) and kind in self.VALID_KINDS:
+            return
         
-        kind = rule_data.get('kind')
         if not kind or not kind.strip():
             errors.append(self.create_error(
                 "Field 'kind' cannot be empty",
                 field='kind'
             ))
-            return errors
-        
-        if kind not in self.VALID_KINDS:
-            valid_values = "', '".join(self.VALID_KINDS)
-            errors.append(self.create_error(
-                f"Field 'kind' has invalid value '{kind}'. "
-                f"Must be one of: '{valid_values}'",
-                field='kind'
-            ))
-        
-        return errors
+            return
+        
+        # Anything left is non-empty and outside VALID_KINDS
+        errors.append(self.create_error(
+            f"Field 'kind' has invalid value '{kind}'. "
+            f"Must be one of: '{self._VALID_KINDS_DISPLAY}'",
+            field='kind'
+        ))
     
-    def _validate_severity(self, rule_data: dict) -> List[Dict]:
+    def _validate_severity(self, severity: str, errors: List[Dict]) -> None:
         """Validate severity field"""
-        errors = []
+        if isinstance(severity, str) and severity in self.VALID_SEVERITIES:
+            return
         
-        severity = rule_data.get('severity')
         if not severity or not severity.strip():
             errors.append(self.create_error(
                 "Field 'severity' cannot be empty",
                 field='severity'
             ))
-            return errors
-        
-        if severity not in self.VALID_SEVERITIES:
-            valid_values = "', '".join(self.VALID_SEVERITIES)
-            errors.append(self.create_error(
-                f"Field 'severity' has invalid value '{severity}'. "
-                f"Must be one of: '{valid_values}'",
-                field='severity'
-            ))
-        
-        return errors
+            return
+        
+        # Anything left is non-empty and outside VALID_SEVERITIES
+        errors.append(self.create_error(
+            f"Field 'severity' has invalid value '{severity}'. "
+            f"Must be one of: '{self._VALID_SEVERITIES_DISPLAY}'",
+            field='severity'
+        ))
     
-    def _validate_trigger_operator(self, rule_data: dict) -> List[Dict]:
+    def _validate_trigger_operator(self, trigger_operator: str, errors: List[Dict]) -> None:
         """Validate triggerOperator field"""
-        errors = []
+        if isinstance(trigger_operator, str) and trigger_operator in self.VALID_TRIGGER_OPERATORS:
+            return
         
-        trigger_operator = rule_data.get('triggerOperator')
         if not trigger_operator or not trigger_operator.strip():
             errors.append(self.create_error(
                 "Field 'triggerOperator' cannot be empty",
                 field='triggerOperator'
             ))
-            return errors
-        
-        if trigger_operator not in self.VALID_TRIGGER_OPERATORS:
-            valid_values = "', '".join(self.VALID_TRIGGER_OPERATORS)
-            errors.append(self.create_error(
-                f"Field 'triggerOperator' has invalid value '{trigger_operator}'. "
-                f"Must be one of: '{valid_values}'",
-                field='triggerOperator'
-            ))
-        
-        return errors
+            return
+        
+        # Anything left is non-empty and outside VALID_TRIGGER_OPERATORS
+        errors.append(self.create_error(
+            f"Field 'triggerOperator' has invalid value '{trigger_operator}'. "
+            f"Must be one of: '{self._VALID_TRIGGER_OPERATORS_DISPLAY}'",
+            field='triggerOperator'
+        ))
     
-    def _validate_trigger_threshold(self, rule_data: dict) -> List[Dict]:
+    def _validate_trigger_threshold(self, trigger_threshold: int, errors: List[Dict]) -> None:
         """Validate triggerThreshold field"""
-        errors = []
-        
-        trigger_threshold = rule_data.get('triggerThreshold')
         if trigger_threshold is None:
             # Missing triggerThreshold would be caught by schema validator
-            return errors
+            return
         
         # Check type
         if not isinstance(trigger_threshold, int):
@@ -197,7 +244,7 @@ class SentinelConstraintsValidator(BaseValidator):
                 f"Field 'triggerThreshold' must be an integer, got {type(trigger_threshold).__name__}",
                 field='triggerThreshold'
             ))
-            return errors
+            return
         
         # Check range
         if trigger_threshold < 0 or trigger_threshold > self.MAX_TRIGGER_THRESHOLD:
@@ -206,92 +253,85 @@ class SentinelConstraintsValidator(BaseValidator):
                 f"got {trigger_threshold}",
                 field='triggerThreshold'
             ))
-        
-        return errors
     
-    def _validate_tactics(self, rule_data: dict) -> List[Dict]:
+    def _validate_tactics(self, tactics: list, errors: List[Dict]) -> None:
         """Validate tactics field against MITRE ATT&CK v13"""
-        errors = []
-        
-        tactics = rule_data.get('tactics')
         if not tactics:
             # Tactics is mandatory according to documentation
-            return errors  # Would be caught by schema validator if truly required
+            return  # Would be caught by schema validator if truly required
         
-        if not isinstance(tactics, list):
+        if type(tactics) is not list:
             errors.append(self.create_error(
                 f"Field 'tactics' must be a list, got {type(tactics).__name__}",
                 field='tactics'
             ))
-            return errors
+            return
         
-        # Validate each tactic
+        # Validate each tactic; the loop runs once per tactic, so bind its
+        # lookups to locals
+        append = errors.append
+        create_error = self.create_error
+        valid_tactics = self.VALID_TACTICS
         for idx, tactic in enumerate(tactics):
             if not isinstance(tactic, str):
-                errors.append(self.create_error(
+                append(create_error(
                     f"Tactic at index {idx} must be a string, got {type(tactic).__name__}",
                     field=f'tactics[{idx}]'
                 ))
                 continue
             
             # Check if tactic is in valid list
-            if tactic not in self.VALID_TACTICS:
+            if tactic not in valid_tactics:
                 # Check if it might be a spacing issue
                 tactic_no_space = tactic.replace(" ", "")
-                if tactic_no_space in self.VALID_TACTICS:
-                    errors.append(self.create_error(
+                if tactic_no_space in valid_tactics:
+                    append(create_error(
                         f"Tactic '{tactic}' contains spaces. "
                         f"MITRE ATT&CK tactics must not contain spaces. Use '{tactic_no_space}' instead",
                         field=f'tactics[{idx}]'
                     ))
                 else:
-                    valid_list = ", ".join(self.VALID_TACTICS)
-                    errors.append(self.create_error(
+                    append(create_error(
                         f"Tactic '{tactic}' is not a valid MITRE ATT&CK v13 tactic. "
-                        f"Valid tactics are: {valid_list}",
+                        f"Valid tactics are: {self._VALID_TACTICS_DISPLAY}",
                         field=f'tactics[{idx}]'
                     ))
-        
-        return errors
     
-    def _validate_relevant_techniques(self, rule_data: dict) -> List[Dict]:
+    def _validate_relevant_techniques(self, techniques: list, errors: List[Dict]) -> None:
         """Validate relevantTechniques field format"""
-        errors = []
-        
-        techniques = rule_data.get('relevantTechniques')
         if not techniques:
             # relevantTechniques is mandatory according to documentation
-            return errors  # Would be caught by schema validator if truly required
+            return  # Would be caught by schema validator if truly required
         
-        if not isinstance(techniques, list):
+        if type(techniques) is not list:
             errors.append(self.create_error(
                 f"Field 'relevantTechniques' must be a list, got {type(techniques).__name__}",
                 field='relevantTechniques'
             ))
-            return errors
+            return
         
-        # Validate each technique
+        # Validate each technique; the loop runs once per technique, so bind
+        # its lookups to locals
+        append = errors.append
+        create_error = self.create_error
+        match_technique = _TECHNIQUE_PATTERN.match
         for idx, technique in enumerate(techniques):
             if not isinstance(technique, str):
-                errors.append(self.create_error(
+                append(create_error(
                     f"Technique at index {idx} must be a string, got {type(technique).__name__}",
                     field=f'relevantTechniques[{idx}]'
                 ))
                 continue
             
-            # Validate format: T#### or T####.### (T1000-T1999 range)
-            # Main technique pattern: T followed by 4 digits
-            # Sub-technique pattern: T####.### (up to 3 digits after decimal)
-            
-            if not self._is_valid_technique_format(technique):
-                errors.append(self.create_error(
+            # Validate format: T#### or T####.### (T1000-T1999 range), as in
+            # _is_valid_technique_format
+            if not match_technique(technique):
+                append(create_error(
                     f"Technique '{technique}' has invalid format. "
                     f"Must be 'T####' (e.g., T1078) or 'T####.###' (e.g., T1078.001) "
                     f"where #### is in range 1000-1999",
                     field=f'relevantTechniques[{idx}]'
                 ))
-        
-        return errors
     
     def _is_valid_technique_format(self, technique: str) -> bool:
         """
@@ -299,40 +339,18 @@ class SentinelConstraintsValidator(BaseValidator):
         Valid formats: T1234 or T1234.001
         Technique ID range: T1000-T1999
         """
-        # Pattern: T followed by 4 digits, optionally followed by . and 1-3 digits
-        pattern = r'^T(\d{4})(?:\.(\d{1,3}))?$'
-        match = re.match(pattern, technique)
-        
-        if not match:
-            return False
-        
-        # Extract technique number
-        technique_num = int(match.group(1))
-        
-        # Validate range (T1000-T1999)
-        if technique_num < 1000 or technique_num > 1999:
-            return False
-        
-        # If sub-technique exists, validate it
-        if match.group(2):
-            sub_technique_num = int(match.group(2))
-            # Sub-techniques typically range from 001-999
-            if sub_technique_num < 1 or sub_technique_num > 999:
-                return False
-        
-        return True
+        # The pattern enforces the technique range and rejects an all-zero
+        # sub-technique (sub-techniques range from 001-999)
+        return _TECHNIQUE_PATTERN.match(technique) is not None
     
-    def _validate_name_constraints(self, rule_data: dict) -> List[Dict]:
+    def _validate_name_constraints(self, name: str, errors: List[Dict]) -> None:
         """Validate name field constraints"""
-        errors = []
-        
-        name = rule_data.get('name')
         if not name:
             # Missing name would be caught by schema validator
-            return errors
+            return
         
         if not isinstance(name, str):
-            return errors  # Type error would be caught by schema validator
+            return  # Type error would be caught by schema validator
         
         # Check maximum length
         if len(name) > self.MAX_NAME_LENGTH:
@@ -348,20 +366,15 @@ class SentinelConstraintsValidator(BaseValidator):
                 f"Field 'name' must not end with a period",
                 field='name'
             ))
-        
-        return errors
     
-    def _validate_description_constraints(self, rule_data: dict) -> List[Dict]:
+    def _validate_description_constraints(self, description: str, errors: List[Dict]) -> None:
         """Validate description field constraints"""
-        errors = []
-        
-        description = rule_data.get('description')
         if not description:
             # Missing description would be caught by schema validator
-            return errors
+            return
         
         if not isinstance(description, str):
-            return errors  # Type error would be caught by schema validator
+            return  # Type error would be caught by schema validator
         
         # Check maximum length
         if len(description) > self.MAX_DESCRIPTION_LENGTH:
@@ -372,20 +385,15 @@ class SentinelConstraintsValidator(BaseValidator):
             ))
         
         # Skip content validation per user request
-        
-        return errors
     
-    def _validate_query_constraints(self, rule_data: dict) -> List[Dict]:
+    def _validate_query_constraints(self, query: str, errors: List[Dict]) -> None:
         """Validate query field constraints"""
-        errors = []
-        
-        query = rule_data.get('query')
         if not query:
             # Missing query would be caught by schema validator
-            return errors
+            return
         
         if not isinstance(query, str):
-            return errors  # Type error would be caught by schema validator
+            return  # Type error would be caught by schema validator
         
         # Check maximum length
         if len(query) > self.MAX_QUERY_LENGTH:
@@ -395,80 +403,63 @@ class SentinelConstraintsValidator(BaseValidator):
                 f"Consider moving static lists to watchlists or using KQL functions.",
                 field='query'
             ))
-        
-        return errors
     
-    def _validate_version(self, rule_data: dict) -> List[Dict]:
+    def _validate_version(self, version: str, errors: List[Dict]) -> None:
         """Validate version field format"""
-        errors = []
-        
-        version = rule_data.get('version')
         if not version or not version.strip():
             errors.append(self.create_error(
                 "Field 'version' cannot be empty",
                 field='version'
             ))
-            return errors
+            return
         
         if not isinstance(version, str):
             errors.append(self.create_error(
                 f"Field 'version' must be a string, got {type(version).__name__}",
                 field='version'
             ))
-            return errors
+            return
         
         # Validate semantic versioning format: a.b.c
         # Where a = major, b = minor, c = patch
-        version_pattern = r'^\d+\.\d+\.\d+$'
-        
-        if not re.match(version_pattern, version):
+        if not _VERSION_PATTERN.match(version):
             errors.append(self.create_error(
                 f"Field 'version' has invalid format '{version}'. "
                 f"Must follow semantic versioning format 'a.b.c' (e.g., '1.0.0', '1.2.3')",
                 field='version'
             ))
-        
-        return errors
     
-    def _validate_event_grouping(self, rule_data: dict) -> List[Dict]:
+    def _validate_event_grouping(self, event_grouping: dict, errors: List[Dict]) -> None:
         """Validate eventGroupingSettings field"""
-        errors = []
-        
-        event_grouping = rule_data.get('eventGroupingSettings')
         if not event_grouping:
             # Optional field
-            return errors
+            return
         
-        if not isinstance(event_grouping, dict):
+        if type(event_grouping) is not dict:
             errors.append(self.create_error(
                 f"Field 'eventGroupingSettings' must be a dictionary, got {type(event_grouping).__name__}",
                 field='eventGroupingSettings'
             ))
-            return errors
+            return
         
         aggregation_kind = event_grouping.get('aggregationKind')
         if aggregation_kind:
-            if aggregation_kind not in self.VALID_AGGREGATION_KINDS:
-                valid_values = "', '".join(self.VALID_AGGREGATION_KINDS)
+            # Non-string values (lists, dicts) are not hashable, and are never valid
+            if not isinstance(aggregation_kind, str) or aggregation_kind not in self.VALID_AGGREGATION_KINDS:
                 errors.append(self.create_error(
                     f"Field 'eventGroupingSettings.aggregationKind' has invalid value '{aggregation_kind}'. "
-                    f"Must be one of: '{valid_values}'",
+                    f"Must be one of: '{self._VALID_AGGREGATION_KINDS_DISPLAY}'",
                     field='eventGroupingSettings.aggregationKind'
                 ))
-        
-        return errors
     
-    def _validate_entity_mappings_limits(self, rule_data: dict) -> List[Dict]:
+    def _validate_entity_mappings_limits(self, entity_mappings: list, errors: List[Dict]) -> None:
         """Validate entity mappings count limits"""
-        errors = []
-        
-        entity_mappings = rule_data.get('entityMappings')
         if not entity_mappings:
             # Optional field
-            return errors
+            return
         
-        if not isinstance(entity_mappings, list):
-            return errors  # Type error would be caught elsewhere
+        if type(entity_mappings) is not list:
+            return  # Type error would be caught elsewhere
         
         # Check maximum number of entity mappings
         if len(entity_mappings) > self.MAX_ENTITY_MAPPINGS:
@@ -480,11 +471,11 @@ class SentinelConstraintsValidator(BaseValidator):
         
         # Check field mappings per entity
         for idx, entity in enumerate(entity_mappings):
-            if not isinstance(entity, dict):
+            if type(entity) is not dict:
                 continue
             
             field_mappings = entity.get('fieldMappings')
-            if not field_mappings or not isinstance(field_mappings, list):
+            if not field_mappings or type(field_mappings) is not list:
                 continue
             
             if len(field_mappings) > self.MAX_FIELD_MAPPINGS_PER_ENTITY:
@@ -495,24 +486,19 @@ class SentinelConstraintsValidator(BaseValidator):
                     f"Current count: {len(field_mappings)} field mappings",
                     field=f'entityMappings[{idx}].fieldMappings'
                 ))
-        
-        return errors
     
-    def _validate_custom_details(self, rule_data: dict) -> List[Dict]:
+    def _validate_custom_details(self, custom_details: dict, errors: List[Dict]) -> None:
         """Validate customDetails field limits"""
-        errors = []
-        
-        custom_details = rule_data.get('customDetails')
         if not custom_details:
             # Optional field
-            return errors
+            return
         
-        if not isinstance(custom_details, dict):
+        if type(custom_details) is not dict:
             errors.append(self.create_error(
                 f"Field 'customDetails' must be a dictionary, got {type(custom_details).__name__}",
                 field='customDetails'
             ))
-            return errors
+            return
         
         # Check maximum number of custom details (key/value pairs)
         if len(custom_details) > self.MAX_CUSTOM_DETAILS:
@@ -521,17 +507,12 @@ class SentinelConstraintsValidator(BaseValidator):
                 f"Current count: {len(custom_details)} pairs",
                 field='customDetails'
             ))
-        
-        return errors
     
-    def _validate_custom_details_keys(self, rule_data: dict) -> List[Dict]:
+    def _validate_custom_details_keys(self, custom_details: dict, errors: List[Dict]) -> None:
         """Validate customDetails keys: must start with a letter and contain only alphanumeric chars"""
-        errors = []
-        custom_details = rule_data.get('customDetails')
-        if not custom_details or not isinstance(custom_details, dict):
-            return errors
+        if not custom_details or type(custom_details) is not dict:
+            return
 
-        pattern = re.compile(r'^[A-Za-z][A-Za-z0-9]*$')
         for key in custom_details.keys():
             # key should be a non-empty string
             if not isinstance(key, str) or not key.strip():
@@ -548,60 +529,55 @@ class SentinelConstraintsValidator(BaseValidator):
                     field=f'customDetails.{key}'
                 ))
 
-            if not pattern.match(key):
+            if not _CUSTOM_DETAILS_KEY_PATTERN.match(key):
                 errors.append(self.create_error(
                     f"customDetails field name '{key}' is invalid. Field names must start with a letter and contain only alphanumeric characters (A-Z, a-z, 0-9).",
                     field=f'customDetails.{key}'
                 ))
-        return errors
     
-    def _validate_alert_details_override(self, rule_data: dict) -> List[Dict]:
+    def _validate_alert_details_override(self, alert_override: dict, errors: List[Dict]) -> None:
         """Validate alertDetailsOverride field constraints"""
-        errors = []
-        
-        alert_override = rule_data.get('alertDetailsOverride')
         if not alert_override:
             # Optional field
-            return errors
+            return
         
-        if not isinstance(alert_override, dict):
+        if type(alert_override) is not dict:
             errors.append(self.create_error(
                 f"Field 'alertDetailsOverride' must be a dictionary, got {type(alert_override).__name__}",
                 field='alertDetailsOverride'
             ))
-            return errors
+            return
         
         # Validate alertDisplayNameFormat
         display_name = alert_override.get('alertDisplayNameFormat')
         if display_name:
-            errors.extend(self._validate_alert_format_field(
+            self._validate_alert_format_field(
                 display_name,
                 'alertDisplayNameFormat',
-                self.MAX_ALERT_NAME_LENGTH
-            ))
+                self.MAX_ALERT_NAME_LENGTH,
+                errors
+            )
         
         # Validate alertDescriptionFormat
         description = alert_override.get('alertDescriptionFormat')
         if description:
-            errors.extend(self._validate_alert_format_field(
+            self._validate_alert_format_field(
                 description,
                 'alertDescriptionFormat',
-                self.MAX_ALERT_DESCRIPTION_LENGTH
-            ))
-        
-        return errors
+                self.MAX_ALERT_DESCRIPTION_LENGTH,
+                errors
+            )
     
-    def _validate_alert_format_field(self, value: str, field_name: str, max_length: int) -> List[Dict]:
+    def _validate_alert_format_field(self, value: str, field_name: str, max_length: int,
+                                     errors: List[Dict]) -> None:
         """Validate alert format fields (name and description)"""
-        errors = []
-        
         if not isinstance(value, str):
             errors.append(self.create_error(
                 f"Field 'alertDetailsOverride.{field_name}' must be a string, "
                 f"got {type(value).__name__}",
                 field=f'alertDetailsOverride.{field_name}'
             ))
-            return errors
+            return
         
         # Check maximum length
         if len(value) > max_length:
@@ -612,51 +588,51 @@ class SentinelConstraintsValidator(BaseValidator):
             ))
         
         # Count parameters ({{columnName}} format)
-        # Pattern to match {{columnName}} with optional whitespace
-        param_pattern = r'\{\{\s*\w+\s*\}\}'
-        parameters = re.findall(param_pattern, value)
+        parameter_count = len(_ALERT_PARAMETER_PATTERN.findall(value))
         
-        if len(parameters) > self.MAX_ALERT_PARAMETERS:
+        if parameter_count > self.MAX_ALERT_PARAMETERS:
             errors.append(self.create_error(
                 f"Field 'alertDetailsOverride.{field_name}' exceeds maximum of "
-                f"{self.MAX_ALERT_PARAMETERS} parameters. Current count: {len(parameters)} parameters. "
+                f"{self.MAX_ALERT_PARAMETERS} parameters. Current count: {parameter_count} parameters. "
                 f"Parameters must be in format {{{{columnName}}}}",
                 field=f'alertDetailsOverride.{field_name}'
             ))
         
-        # Validate parameter format (no leading/trailing spaces inside braces)
-        for param in parameters:
-            # Extract content between {{ and }}
-            inner = param[2:-2]
-            if inner != inner.strip():
-                errors.append(self.create_error(
-                    f"Parameter '{param}' in 'alertDetailsOverride.{field_name}' has leading or trailing "
-                    f"whitespace. Must be in format {{{{columnName}}}} without spaces inside braces",
-                    field=f'alertDetailsOverride.{field_name}'
-                ))
-                break  # Only report once per field
-        
-        return errors
+        # Validate parameter format (no leading/trailing spaces inside braces).
+        # Every spaced parameter is also a counted one, so the first match here
+        # is the first offending parameter; only report once per field
+        spaced_param = _SPACED_ALERT_PARAMETER_PATTERN.search(value) if parameter_count else None
+        if spaced_param:
+            errors.append(self.create_error(
+                f"Parameter '{spaced_param.group()}' in 'alertDetailsOverride.{field_name}' has leading or trailing "
+                f"whitespace. Must be in format {{{{columnName}}}} without spaces inside braces",
+                field=f'alertDetailsOverride.{field_name}'
+            ))
     
-    def _validate_grouping_configuration(self, rule_data: dict) -> List[Dict]:
+    def _validate_grouping_configuration(self, incident_config: dict, errors: List[Dict]) -> None:
         """Validate grouping configuration and lookback duration"""
-        errors = []
+        # A missing section has nothing to check, but an explicit null is
+        # still reported as not being a dictionary
+        if incident_config is _MISSING:
+            return
         
-        incident_config = rule_data.get('incidentConfiguration', {})
-        if not isinstance(incident_config, dict):
+        if type(incident_config) is not dict:
             errors.append(self.create_error(
                 "Field 'incidentConfiguration' must be a dictionary",
                 field='incidentConfiguration'
             ))
-            return errors
+            return
+        
+        grouping_config = incident_config.get('groupingConfiguration', _MISSING)
+        if grouping_config is _MISSING:
+            return
         
-        grouping_config = incident_config.get('groupingConfiguration', {})
-        if not isinstance(grouping_config, dict):
+        if type(grouping_config) is not dict:
             errors.append(self.create_error(
                 "Field 'groupingConfiguration' must be a dictionary",
                 field='incidentConfiguration.groupingConfiguration'
             ))
-            return errors
+            return
         
         enabled = grouping_config.get('enabled')
         if enabled:
@@ -667,7 +643,7 @@ class SentinelConstraintsValidator(BaseValidator):
                     "When grouping is enabled, lookbackDuration must be specified",
                     field='incidentConfiguration.groupingConfiguration.lookbackDuration'
                 ))
-                return errors
+                return
             
             # Convert lookback duration to hours for validation
             try:
@@ -687,26 +663,23 @@ class SentinelConstraintsValidator(BaseValidator):
                     f"Invalid lookbackDuration format: {str(e)}",
                     field='incidentConfiguration.groupingConfiguration.lookbackDuration'
                 ))
-        
-        return errors
 
     def _parse_duration_to_hours(self, duration: str) -> float:
         """Convert duration string to hours"""
         if not isinstance(duration, str):
             raise ValueError("Duration must be a string")
         
-        # Remove whitespace and convert to lowercase
-        duration = duration.strip().lower()
+        # Remove whitespace; the number is parsed case-insensitively by float()
+        # and the unit table has both cases, so no lowercased copy is needed
+        duration = duration.strip()
         
         if not duration:
             raise ValueError("Duration cannot be empty")
         
-        # Handle different time units
-        if duration.endswith('h'):
-            return float(duration[:-1])
-        elif duration.endswith('d'):
-            return float(duration[:-1]) * 24
-        elif duration.endswith('m'):
-            return float(duration[:-1]) / 60
-        else:
-            raise ValueError("Duration must end with 'm', 'h', or 'd'")
+        # The last character is the unit
+        try:
+            multiplier, divisor = _DURATION_UNIT_SCALES[duration[-1]]
+        except KeyError:
+            raise ValueError("Duration must end with 'm', 'h', or 'd'") from None
+        
+        return float(duration[:-1]) * multiplier / divisor
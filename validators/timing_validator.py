@@ -3,34 +3,77 @@ Timing Validator
 Validates queryFrequency and queryPeriod fields.
 """
 
+import functools
 import re
 from pathlib import Path
 from typing import List, Dict, Optional
 
 from .base_validator import BaseValidator
 
+# Number followed by unit (m, h, d), in either case
+_TIME_PATTERN = re.compile(r'^(\d+)([mhd])$', re.IGNORECASE)
+
+# Minutes per time unit
+_UNIT_MULTIPLIERS = {
+    'm': 1,
+    'h': 60,
+    'd': 1440
+}
+
+# Longest allowed queryPeriod: 14 days
+_MAX_PERIOD_MINUTES = 20160
+
+# Real timing values are at most 6 characters ('20160m'); anything much longer
+# is rejected as malformed without being parsed or kept in the parse cache
+_MAX_TIME_STRING_LENGTH = 16
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_minutes(time_str: str) -> Optional[int]:
+    """
+    Convert a time string like '5m', '1h' or '2d' to minutes.
+    
+    Rules reuse a handful of distinct timing values, so results are memoized.
+    Returns None if the string is not a number followed by a unit.
+    """
+    match = _TIME_PATTERN.match(time_str)
+    if not match:
+        return None
+    return int(match[1]) * _UNIT_MULTIPLIERS[match[2].lower()]
+
 
 class TimingValidator(BaseValidator):
     """Validates query timing fields"""
     
+    __slots__ = ()
+    
     @property
     def validator_name(self) -> str:
         return "Timing Validator"
     
     def validate(self, rule_data: dict, file_path: Path, all_files: List[Path] = None) -> List[Dict]:
         """Validate timing fields"""
-        errors = []
-        
         query_frequency = rule_data.get('queryFrequency')
         query_period = rule_data.get('queryPeriod')
         
+        # Every check below needs at least one of the fields (NRT rules have neither).
+        # Callers may extend the result, so an empty list is not shared
+        if not query_frequency and not query_period:
+            return []
+        
+        errors = []
+        
         # Validate format and parse values
         freq_minutes = None
         period_minutes = None
         
+        # Well-formed strings are answered straight from the parse cache;
+        # _parse_time_value is only called to build the error for the rest
         if query_frequency:
-            freq_minutes, freq_error = self._parse_time_value(query_frequency, 'queryFrequency')
-            if freq_error:
+            if type(query_frequency) is str and len(query_frequency) <= _MAX_TIME_STRING_LENGTH:
+                freq_minutes = _parse_minutes(query_frequency)
+            if freq_minutes is None:
+                freq_minutes, freq_error = self._parse_time_value(query_frequency, 'queryFrequency')
                 errors.append(freq_error)
           # Add check for minimum frequency
             elif freq_minutes < 5:
@@ -41,8 +84,10 @@ class TimingValidator(BaseValidator):
                 ))
         
         if query_period:
-            period_minutes, period_error = self._parse_time_value(query_period, 'queryPeriod')
-            if period_error:
+            if type(query_period) is str and len(query_period) <= _MAX_TIME_STRING_LENGTH:
+                period_minutes = _parse_minutes(query_period)
+            if period_minutes is None:
+                period_minutes, period_error = self._parse_time_value(query_period, 'queryPeriod')
                 errors.append(period_error)
         
         # Validate constraints if both values are valid
@@ -70,11 +115,10 @@ class TimingValidator(BaseValidator):
         
         if period_minutes is not None:
             # Check: queryPeriod <= 14 days (20160 minutes)
-            max_period_minutes = 14 * 24 * 60  # 20160 minutes
-            if period_minutes > max_period_minutes:
+            if period_minutes > _MAX_PERIOD_MINUTES:
                 errors.append(self.create_error(
                     f"queryPeriod '{query_period}' ({period_minutes} minutes) exceeds "
-                    f"maximum of 14 days ({max_period_minutes} minutes)",
+                    f"maximum of 14 days ({_MAX_PERIOD_MINUTES} minutes)",
                     field='queryPeriod'
                 ))
         
@@ -93,16 +137,16 @@ class TimingValidator(BaseValidator):
             Returns (None, error) if parsing fails
             Returns (minutes, None) if parsing succeeds
         """
-        if not isinstance(time_str, str):
+        # YAML scalars are exactly str, so an identity check on the type is enough
+        if type(time_str) is not str:
             return None, self.create_error(
                 f"Field '{field_name}' must be a string, got {type(time_str).__name__}",
                 field=field_name
             )
         
-        # Match pattern: number followed by unit (m, h, d)
-        match = re.match(r'^(\d+)([mhd])$', time_str.lower())
+        minutes = _parse_minutes(time_str) if len(time_str) <= _MAX_TIME_STRING_LENGTH else None
         
-        if not match:
+        if minutes is None:
             return None, self.create_error(
                 f"Field '{field_name}' has invalid format: '{time_str}'. "
                 f"Expected format: <number><unit> where unit is 'm' (minutes), 'h' (hours), or 'd' (days). "
@@ -110,16 +154,4 @@ class TimingValidator(BaseValidator):
                 field=field_name
             )
         
-        value, unit = match.groups()
-        value = int(value)
-        
-        # Convert to minutes
-        unit_multipliers = {
-            'm': 1,
-            'h': 60,
-            'd': 1440
-        }
-        
-        minutes = value * unit_multipliers[unit]
-        
         return minutes, None